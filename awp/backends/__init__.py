@@ -6,6 +6,10 @@ Lean Mode = use feh instead of native desktop wallpaper setter.
 import os
 import sys
 import importlib
+import importlib.util
+import time
+import select
+import subprocess
 import configparser
 from pathlib import Path
 from core.printer import get_printer
@@ -111,6 +115,110 @@ ForegroundNormal=#cfcfc2
     _printer.info(f"Qt6 & KDE accents synced in RAM: {accent_color} (selection: #{dark_raw})", backend="common")
 
 
+# ============================================================================
+# SHARED X11 WORKSPACE DETECTION
+# ============================================================================
+
+# python-xlib is optional; without it workspace polls shell out to xprop
+HAS_XLIB = importlib.util.find_spec("Xlib") is not None
+
+# (display, root window, _NET_CURRENT_DESKTOP atom) once connected
+_x11 = None
+# True once the root window's PropertyNotify events are selected
+_x11_events = False
+
+def _x11_connect():
+    """Return the shared (display, root, atom) connection, or None without Xlib/X11."""
+    global _x11, _x11_events
+    if _x11 is None and HAS_XLIB:
+        try:
+            from Xlib import display as xdisplay
+            d = xdisplay.Display()
+            _x11 = (d, d.screen().root, d.intern_atom('_NET_CURRENT_DESKTOP'))
+            _x11_events = False
+        except Exception:
+            _x11 = None
+    return _x11
+
+def _x11_drop():
+    """Close and forget the connection so the next call reconnects (e.g. X server restarted)."""
+    global _x11
+    if _x11 is not None:
+        try:
+            _x11[0].close()
+        except Exception:
+            pass  # Already broken: the socket is released either way
+    _x11 = None
+
+def x11_current_desktop() -> int:
+    """
+    Read _NET_CURRENT_DESKTOP from the X11 root window.
+
+    With python-xlib the display connection is opened once and kept, so each
+    poll is one X round trip instead of an xprop fork/exec. Falls back to
+    xprop when Xlib is missing or the connection fails; raises if both fail.
+    """
+    conn = _x11_connect()
+    if conn is not None:
+        try:
+            from Xlib import X
+            _, root, atom = conn
+            prop = root.get_full_property(atom, X.AnyPropertyType)
+            if prop is not None and len(prop.value):
+                return int(prop.value[0])
+        except Exception:
+            _x11_drop()
+
+    ws_num = subprocess.check_output(
+        ["xprop", "-root", "_NET_CURRENT_DESKTOP"],
+        text=True
+    ).strip().split()[-1]
+    return int(ws_num)
+
+def x11_wait_desktop_change(timeout: float) -> bool:
+    """
+    Sleep up to timeout seconds, waking early when the desktop switches.
+
+    Uses PropertyNotify on the root window, so the caller blocks in select()
+    until the WM updates _NET_CURRENT_DESKTOP. Without Xlib/X11 this is a
+    plain time.sleep(timeout).
+
+    Returns:
+        bool: True if woken by a desktop switch, False on timeout
+    """
+    global _x11_events
+    conn = _x11_connect()
+    if conn is None:
+        time.sleep(timeout)
+        return False
+
+    from Xlib import X
+    d, root, atom = conn
+    deadline = time.monotonic() + timeout
+    try:
+        if not _x11_events:
+            root.change_attributes(event_mask=X.PropertyChangeMask)
+            _x11_events = True
+        while True:
+            switched = False
+            while d.pending_events():
+                event = d.next_event()
+                if event.type == X.PropertyNotify and event.atom == atom:
+                    switched = True
+            if switched:
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            select.select([d], [], [], remaining)
+    except Exception:
+        _x11_drop()
+        remaining = deadline - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+        return False
+
+
 # ============================================================================
 # BACKEND CONFIGURATION
 # ============================================================================
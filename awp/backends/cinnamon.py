@@ -10,7 +10,7 @@ import subprocess
 import json
 import configparser
 from core.constants import SCALING_FEH
-from backends import ensure_qt6_kde_symlinks, write_qt6_kde_accent
+from backends import ensure_qt6_kde_symlinks, write_qt6_kde_accent, x11_current_desktop
 from core.printer import get_printer
 
 ensure_qt6_kde_symlinks()
@@ -43,12 +43,9 @@ def cinnamon_current_ws():
         return int(ws_num)
         
     except Exception as e:
-        # Fallback to xprop if D-Bus is stubborn on older Mint versions
+        # Fallback to the X11 root window if D-Bus is stubborn on older Mint versions
         try:
-            ws_num = subprocess.check_output(
-                ["xprop", "-root", "_NET_CURRENT_DESKTOP"], 
-                text=True).strip().split()[-1]
-            return int(ws_num)
+            return x11_current_desktop()
         except:
             _printer.error(f"Cinnamon detection failed: {e}", backend="cinnamon")
             return 0
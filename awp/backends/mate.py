@@ -13,7 +13,7 @@ import configparser
 from core.constants import SCALING_FEH
 from core.printer import get_printer
 
-from backends import ensure_qt6_kde_symlinks, write_qt6_kde_accent
+from backends import ensure_qt6_kde_symlinks, write_qt6_kde_accent, x11_current_desktop
 
 ensure_qt6_kde_symlinks()
 
@@ -33,17 +33,11 @@ def mate_current_ws():
     Provides safety and logging for the MATE backend.
     """
     try:
-        import subprocess
         # Get the raw workspace index from the root window
-        ws_num = subprocess.check_output(
-            ["xprop", "-root", "_NET_CURRENT_DESKTOP"], 
-            text=True
-        ).strip().split()[-1]
-        
-        return int(ws_num)
+        return x11_current_desktop()
     except Exception as e:
         # Using your existing printer logic
-        _printer.error(f"X11 xprop failed: {e}", backend="mate")
+        _printer.error(f"X11 workspace detection failed: {e}", backend="mate")
         return 0
 
 
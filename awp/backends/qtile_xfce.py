@@ -14,6 +14,7 @@ import configparser
 import time
 from core.constants import SCALING_FEH
 from core.printer import get_printer
+from backends import x11_current_desktop
 
 # Get printer instance
 _printer = get_printer()
@@ -33,14 +34,9 @@ def qtile_xfce_current_ws():
     except Exception as e:
         print(f"Failed to read workspace from /dev/shm: {e}")
     
-    # Fallback to xprop
+    # Fallback to the X11 root window
     try:
-        import subprocess
-        ws_num = subprocess.check_output(
-            ["xprop", "-root", "_NET_CURRENT_DESKTOP"], 
-            text=True
-        ).strip().split()[-1]
-        return int(ws_num)
+        return x11_current_desktop()
     except:
         return 0
 
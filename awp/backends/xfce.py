@@ -12,7 +12,7 @@ import time
 
 from core.constants import SCALING_FEH
 from core.printer import get_printer
-from backends import ensure_qt6_kde_symlinks, write_qt6_kde_accent
+from backends import ensure_qt6_kde_symlinks, write_qt6_kde_accent, x11_current_desktop
 
 ensure_qt6_kde_symlinks()
 
@@ -30,16 +30,10 @@ def xfce_current_ws():
     Provides safety and logging for the XFCE backend.
     """
     try:
-        import subprocess
         # Get the raw workspace index from the root window
-        ws_num = subprocess.check_output(
-            ["xprop", "-root", "_NET_CURRENT_DESKTOP"], 
-            text=True
-        ).strip().split()[-1]
-        
-        return int(ws_num)
+        return x11_current_desktop()
     except Exception as e:
-        _printer.error(f"X11 xprop failed: {e}", backend="xfce")
+        _printer.error(f"X11 workspace detection failed: {e}", backend="xfce")
         return 0
 
 
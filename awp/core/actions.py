@@ -6,13 +6,18 @@ Core Actions Module
 Shared business logic
 """
 import os
+import re
 import json
+import queue
+import configparser
 import random
+import functools
+import threading
 import subprocess
 from pathlib import Path
 from typing import List, Tuple, Optional
 
-from .constants import AWP_DIR, STATE_PATH, RUNTIME_STATE_PATH
+from .constants import AWP_DIR, STATE_PATH, RUNTIME_STATE_PATH, WS_KEYS
 from .config import AWPConfig
 from backends import get_backend
 from core.utils import load_images, sort_images
@@ -23,6 +28,8 @@ _printer = get_printer()
 
 def get_ws_key(ws_num: int) -> str:
     """Get workspace key for state storage."""
+    if 0 <= ws_num < len(WS_KEYS):
+        return WS_KEYS[ws_num]
     return f"ws{ws_num+1}"
 
 def get_current_workspace() -> int:
@@ -39,35 +46,107 @@ def get_current_workspace() -> int:
             return 0
     return 0
 
+_TIMING_RE = re.compile(r'(\d+)(\D)')
+_TIMING_UNITS = {'s': 1, 'm': 60, 'h': 3600}
+
+@functools.lru_cache(maxsize=64)
 def parse_timing(timing_str: str) -> int:
     """Convert timing string (e.g., 30s, 7m, 2h) to seconds."""
-    units = {'s': 1, 'm': 60, 'h': 3600}
-    try:
-        unit = timing_str[-1].lower()
-        number = int(timing_str[:-1])
-        return number * units.get(unit, 60)
-    except Exception:
+    # Few distinct values ever occur, so results are memoized
+    m = _TIMING_RE.fullmatch(timing_str or '')
+    if not m:
         return 60  # Default to 60 seconds
+    return int(m.group(1)) * _TIMING_UNITS.get(m.group(2).lower(), 60)
 
 _DE = None
+# Function table of the current DE's backend, resolved once in set_backend()
+_BACKEND = {}
 
 def set_backend(desktop_env: str):
     """Set the global desktop environment backend."""
-    global _DE
+    global _DE, _BACKEND
     _DE = desktop_env
+    _BACKEND = get_backend(desktop_env) or {}
 
 def get_backend_func(func_name: str):
     """Get a backend function for current DE."""
-    backend = get_backend(_DE)
-    if backend:
-        return backend.get(func_name)
-    return None
+    return _BACKEND.get(func_name)
+
+# Queue of the backend worker thread, None until start_backend_worker()
+_JOBS = None
+
+def start_backend_worker(maxsize: int = 32):
+    """
+    Run wallpaper/theme/icon backend calls on one background thread.
 
-def set_wallpaper(ws_num: int, image_path: str, scaling: str):
+    For the long-running daemons only: the calls fork xfconf-query,
+    gsettings, feh... and would otherwise stall the main loop. Short-lived
+    tools (nav.py) keep calling the backend inline, so nothing is lost when
+    they exit.
+    """
+    global _JOBS
+    if _JOBS is None:
+        _JOBS = queue.Queue(maxsize=maxsize)
+        threading.Thread(target=_backend_worker, args=(_JOBS,),
+                         name="awp-backend", daemon=True).start()
+
+def _backend_worker(jobs: queue.Queue):
+    """
+    Run queued backend calls, keeping only the newest per key.
+
+    Each key runs at the position of its last call in the batch: with one
+    desktop-wide wallpaper, a quick ws1 -> ws2 -> ws1 switch must end on
+    ws1's image, not ws2's.
+    """
+    while True:
+        batch = [jobs.get()]
+        while True:
+            try:
+                batch.append(jobs.get_nowait())
+            except queue.Empty:
+                break
+
+        # A newer call for the same key supersedes the older one
+        latest = {}
+        for key, func, args, on_error in batch:
+            latest.pop(key, None)
+            latest[key] = (func, args, on_error)
+
+        for func, args, on_error in latest.values():
+            try:
+                func(*args)
+            except Exception as e:
+                _printer.error(f"Backend call failed: {e}", backend="actions")
+                if on_error:
+                    on_error()
+
+def _run_backend(key, func, *args, on_error=None):
+    """
+    Queue a backend call on the worker if it runs, else call it inline.
+
+    on_error (optional) is called without arguments if the call fails, so
+    callers can forget what they assumed was applied.
+    """
+    if _JOBS is not None:
+        try:
+            _JOBS.put_nowait((key, func, args, on_error))
+            return
+        except queue.Full:
+            pass  # Worker is far behind: do this one ourselves
+    try:
+        func(*args)
+    except Exception:
+        if on_error:
+            on_error()
+        raise
+
+def set_wallpaper(ws_num: int, image_path: str, scaling: str, on_error=None):
     """Set wallpaper for specified workspace with given scaling."""
     func = get_backend_func("wallpaper")
     if func:
-        func(ws_num, image_path, scaling)
+        # Keyed per workspace: backends like xfce keep one image per workspace
+        _run_backend(("wallpaper", ws_num), func, ws_num, image_path, scaling,
+                     on_error=on_error)
 
 def get_workspace_images(ws_config: dict) -> tuple:
     """Load and sort images for a workspace based on its config."""
@@ -92,17 +171,35 @@ def get_workspace_index(ws_num: int, images: list) -> int:
         idx = 0
     return idx
 
+# Keys of a [wsN] section that the backends' themes() functions read
+THEME_KEYS = ('gtk_theme', 'icon_theme', 'cursor_theme', 'desktop_theme', 'wm_theme', 'icon_color')
+
+def theme_fingerprint(ws_num: int, config) -> tuple:
+    """Theme values set_themes() would apply for a workspace (comparable, hashable)."""
+    section = get_ws_key(ws_num)
+    return tuple(config.get(section, key, fallback='') for key in THEME_KEYS)
+
+def _section_snapshot(config, section: str) -> configparser.ConfigParser:
+    """Detached copy of one section, for backend calls run on the worker."""
+    snapshot = configparser.ConfigParser(interpolation=None)
+    if config.has_section(section):
+        snapshot.read_dict({section: dict(config.items(section, raw=True))})
+    return snapshot
+
 def set_themes(ws_num: int, config=None):
     """Apply theme settings for specified workspace."""
     func = get_backend_func("themes")
     if func:
-        func(ws_num, config)
+        if _JOBS is not None and config is not None:
+            # The worker may run after the daemon re-read the live parser
+            config = _section_snapshot(config, get_ws_key(ws_num))
+        _run_backend("themes", func, ws_num, config)
 
 def set_panel_icon(icon_path: str):
     """Set panel/menu icon for current desktop environment."""
     func = get_backend_func("icon")
     if func:
-        func(icon_path)
+        _run_backend("icon", func, icon_path)
         
 
 def run_awp_start(preset_name: str, awp_dir: str = None) -> bool:
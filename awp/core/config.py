@@ -4,10 +4,12 @@ Centralizes all configuration logic for daemon, nav, dab, and setup modules.
 Handles loading, validation, caching, and workspace-specific configuration.
 """
 import configparser
+import io
 import os
+import shutil
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
-from core.constants import CONFIG_PATH, AWP_DIR
+from core.constants import CONFIG_PATH, AWP_DIR, WS_KEYS
 
 class ConfigError(Exception):
     """Raised when configuration is invalid or missing required sections."""
@@ -25,13 +27,24 @@ class AWPConfig:
         self._workspace_cache = {}
         self._global_cache = {}
         self._loaded = False
+        self._stamp = None
         self._load()
 
+    def _file_stamp(self):
+        """(mtime_ns, size, inode) of the file behind self.path, or None."""
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
     def _load(self):
         """Load configuration file with basic validation."""
         if not self.path.exists():
             raise ConfigError(f"Configuration file not found: {self.path}")
         
+        # Stamp before reading: a write racing the read triggers another reload
+        self._stamp = self._file_stamp()
         self.config.read(self.path)
         self._validate_required_sections()
         self._loaded = True
@@ -155,10 +168,10 @@ class AWPConfig:
     
     def get_workspace_config(self, ws_num: int) -> Dict[str, Any]:
         """Get complete configuration for a workspace."""
-        ws_key = f"ws{ws_num + 1}"
-        cache_key = f"ws_{ws_key}"
+        cache_key = ws_num
         
         if cache_key not in self._workspace_cache:
+            ws_key = WS_KEYS[ws_num] if 0 <= ws_num < len(WS_KEYS) else f"ws{ws_num + 1}"
             self._workspace_cache[cache_key] = {
                 'folder': self.get(ws_key, 'folder', ''),
                 'timing': self.get(ws_key, 'timing', '1m'),
@@ -178,8 +191,7 @@ class AWPConfig:
     def invalidate_workspace_cache(self, ws_num: int = None):
         """Clear workspace cache (call after config changes)."""
         if ws_num is not None:
-            cache_key = f"ws_ws{ws_num + 1}"
-            self._workspace_cache.pop(cache_key, None)
+            self._workspace_cache.pop(ws_num, None)
         else:
             self._workspace_cache.clear()
 
@@ -211,6 +223,18 @@ class AWPConfig:
         self._invalidate_caches()
         self.save()
 
+    def update_section(self, section: str, values: Dict[str, Any], save: bool = True):
+        """
+        Set several keys of one section, then save once.
+
+        Pass save=False to batch several sections and call save() yourself.
+        """
+        for key, value in values.items():
+            self.config.set(section, key, str(value))
+        self._invalidate_caches()
+        if save:
+            self.save()
+
     def save(self):
         """Save configuration with symlink-aware atomic backup."""
         if not self._loaded:
@@ -220,20 +244,36 @@ class AWPConfig:
         # .resolve() turns '~/awp/awp_config.ini' into '~/awp/presets/mood/mood.ini'
         actual_path = self.path.resolve()
         backup_path = actual_path.with_suffix('.bak')
+        tmp_path = actual_path.with_name(actual_path.name + '.tmp')
         
-        # Now we rename the PHYSICAL file, not the link
-        if actual_path.exists():
-            actual_path.rename(backup_path)
+        # Render the whole INI in memory so it hits the disk in one write
+        buf = io.StringIO()
+        self.config.write(buf)
+        data = buf.getvalue().encode('utf-8')
         
         try:
-            # Write directly to the physical file in the preset folder
-            with open(actual_path, 'w') as f:
-                self.config.write(f)
+            # Write and flush the new version next to the physical file
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            
+            # Keep the previous version as .bak (hard link: no data copy)
+            if actual_path.exists():
+                backup_path.unlink(missing_ok=True)
+                try:
+                    os.link(actual_path, backup_path)
+                except OSError:
+                    shutil.copyfile(actual_path, backup_path)
+            
+            # Atomic swap: readers only ever see the old or the new file
+            os.replace(tmp_path, actual_path)
         except Exception as e:
-            # Restore physical backup on failure
-            if backup_path.exists():
-                backup_path.rename(actual_path)
+            tmp_path.unlink(missing_ok=True)
             raise ConfigError(f"Failed to save config: {e}")
+        
+        # Our own write is not an external change
+        self._stamp = self._file_stamp()
 
     def reload(self):
         """Reload configuration from disk and clear caches."""
@@ -242,6 +282,19 @@ class AWPConfig:
         self._workspace_cache.clear()
         self._load()
 
+    def reload_if_changed(self) -> bool:
+        """
+        Reload only if the file changed on disk since it was loaded or saved.
+
+        Compares mtime, size and inode, so a preset switch that repoints the
+        symlink at an older file is caught too. Returns True if reloaded.
+        """
+        stamp = self._file_stamp()
+        if stamp is None or stamp == self._stamp:
+            return False  # Unchanged, or briefly missing while a preset is relinked
+        self.reload()
+        return True
+
     def _invalidate_caches(self):
         """Clear all caches after mutation."""
         self._global_cache.clear()
@@ -7,6 +7,7 @@ Keep it simple, no fancy stuff.
 
 #!/usr/bin/env python3
 import os
+import sys
 from pathlib import Path
 
 # Base Paths
@@ -21,6 +22,15 @@ RUNTIME_STATE_PATH = "/dev/shm/awp_full_state.json"
 AWP_CONFIG_RAM = "/dev/shm/awp_config_ram.json"
 QT6_ACCENT_SHM = "/dev/shm/awp-qt-color.conf"
 KDE_ACCENT_SHM = "/dev/shm/awp-kde-color.colors"
+# Sorted folder listings shared by short-lived tools ({} = folder/order hash),
+# at most LISTING_CACHE_MAX of them (the oldest are pruned)
+LISTING_CACHE_PATH = "/dev/shm/awp_listing_{}.json"
+LISTING_CACHE_MAX = 32
+# Command socket of a long-running `nav.py serve`
+NAV_SOCKET = "/dev/shm/awp_nav.sock"
+
+# Workspace section/state keys ("ws1".."ws16"), built and interned once
+WS_KEYS = tuple(sys.intern(f"ws{i + 1}") for i in range(16))
 
 # System Config Paths (for Symlinking)
 QT6CT_COLORS_DIR = os.path.expanduser("~/.config/qt6ct/colors/")
@@ -30,6 +30,8 @@ class AWPPrinter:
             "utils": CLR_BLUE,
             "core": CLR_YELLOW,
         }
+        # Rendered prefixes, one per module name
+        self._prefixes = {}
     
     def set_backend(self, backend_name):
         """Manually set current backend for context"""
@@ -49,11 +51,13 @@ class AWPPrinter:
         # Determine which module is printing
         module = backend_override or self.backend or "AWP"
         
-        # Get color for this module
-        color = self._get_color(module)
-             
-        return f"{color}[AWP-{module}]{CLR_RESET}"
-    
+        prefix = self._prefixes.get(module)
+        if prefix is None:
+            # Get color for this module
+            color = self._get_color(module)
+            prefix = self._prefixes[module] = f"{color}[AWP-{module}]{CLR_RESET}"
+        return prefix
+
     # ===== CORE PRINT METHODS =====
     def themes(self, ws_num, changes, backend=None):
         """Print theme changes message"""
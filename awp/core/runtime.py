@@ -6,42 +6,136 @@ Responsible for writing unified runtime state.
 
 import os
 import json
+import importlib.util
 from core.constants import AWP_DIR, STATE_PATH, RUNTIME_STATE_PATH, AWP_CONFIG_RAM
 
+def _file_stamp(path: str):
+    """
+    (mtime_ns, size, inode) of path, or None if it is missing.
+
+    Every writer swaps files in with os.replace(), so the inode changes on
+    each write even when mtime is coarse and the size stays the same.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+def _replace_file(path: str, data: bytes):
+    """Write data to path.tmp with a single os.write(), then atomically swap it in."""
+    tmp = path + ".tmp"
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+    os.replace(tmp, path)
+
+# orjson (optional) parses and serialises the state files several times
+# faster than the stdlib; both produce and accept the same JSON
+HAS_ORJSON = importlib.util.find_spec("orjson") is not None
+if HAS_ORJSON:
+    import orjson
+
+def _compact_json(obj) -> bytes:
+    if HAS_ORJSON:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+def parse_json(data: bytes):
+    """Parse JSON bytes with orjson when available. Raises ValueError if invalid."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# Payload of our last runtime state write and the file's stamp after it
+_runtime_written = (None, None)
+
+def _runtime_file_stamp():
+    return _file_stamp(RUNTIME_STATE_PATH)
+
 def update_runtime_state(state_dict: dict):
-    tmp = RUNTIME_STATE_PATH + ".tmp"
-    with open(tmp, "w") as f:
-        json.dump(state_dict, f)
-    os.replace(tmp, RUNTIME_STATE_PATH)
+    """
+    Publish the runtime state for HUDs and other readers.
+
+    Re-applying the same wallpaper produces the same payload; that write is
+    skipped unless another process (e.g. nav.py) replaced the file since.
+    """
+    global _runtime_written
+    data = _compact_json(state_dict)
+    payload, stamp = _runtime_written
+    if data == payload and stamp is not None and _runtime_file_stamp() == stamp:
+        return
+    _replace_file(RUNTIME_STATE_PATH, data)
+    _runtime_written = (data, _runtime_file_stamp())
+
+# Last indexes.json contents and the file's stamp when they were read/written
+_index_state = {}
+_index_stamp = None
+
+def _index_file_stamp():
+    return _file_stamp(STATE_PATH)
 
 def load_index_state() -> dict:
-    """Load workspace state from JSON file."""
-    if not os.path.isfile(STATE_PATH):
-        return {}
-    try:
-        with open(STATE_PATH, "r") as f:
-            return json.load(f)
-    except Exception:
+    """
+    Load workspace state from JSON file.
+
+    The file is only re-read when its stamp changed (e.g. nav.py replaced
+    it), so repeated calls cost one stat(). Returns a copy callers may modify.
+    """
+    global _index_state, _index_stamp
+    stamp = _index_file_stamp()
+    if stamp is None:
         return {}
+    if stamp != _index_stamp:
+        try:
+            with open(STATE_PATH, "rb") as f:
+                _index_state = parse_json(f.read())
+        except Exception:
+            return {}
+        _index_stamp = stamp
+    return dict(_index_state)
 
 def save_index_state(state: dict):
-    """Save workspace state to JSON file."""
-    tmp = STATE_PATH + ".tmp"
-    with open(tmp, "w") as f:
-        json.dump(state, f)
-    os.replace(tmp, STATE_PATH)
+    """Save workspace state to JSON file, skipping writes that change nothing."""
+    global _index_state, _index_stamp
+    if state == _index_state and _index_stamp is not None and _index_file_stamp() == _index_stamp:
+        return
+    _replace_file(STATE_PATH, _compact_json(state))
+    _index_state = dict(state)
+    _index_stamp = _index_file_stamp()
+
+# path -> (file stamp, parsed JSON) for load_json_cached()
+_json_cache = {}
+
+def load_json_cached(path: str):
+    """
+    Parse a JSON file, re-reading it only when it changed on disk.
+
+    For pollers like the HUDs: an unchanged file costs a single stat().
+    Returns None if the file does not exist. The returned object is shared
+    between calls, so callers must not modify it.
+    """
+    stamp = _file_stamp(path)
+    if stamp is None:
+        _json_cache.pop(path, None)
+        return None
+    cached = _json_cache.get(path)
+    if cached and cached[0] == stamp:
+        return cached[1]
+    with open(path, "rb") as f:
+        data = parse_json(f.read())
+    _json_cache[path] = (stamp, data)
+    return data
 
 def update_ram_config(full_config_dict: dict):
     """
     Exports the complete configuration dictionary to a JSON file in RAM (/dev/shm).
     Uses an atomic replace operation to ensure data integrity during concurrent reads.
     """
-    tmp = AWP_CONFIG_RAM + ".tmp"
     try:
-        with open(tmp, "w") as f:
-            json.dump(full_config_dict, f, indent=4)
-        
         # Atomic replacement to prevent partial reads by other processes
-        os.replace(tmp, AWP_CONFIG_RAM)
+        _replace_file(AWP_CONFIG_RAM, json.dumps(full_config_dict, indent=4).encode())
     except Exception as e:
         print(f"Error writing RAM Config: {e}")
@@ -9,6 +9,8 @@ import os
 import shutil
 import subprocess
 import colorsys
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from core.constants import ICON_PRESETS, THEME_PRESETS, CURSOR_PRESETS, TARGET_ASSETS, ICON_SIZES, ICON_REGISTRY
 from core.utils import (
     hex_to_hsv, 
@@ -600,11 +602,10 @@ def bake_awp_cursor(hex_color: str, icon: str = None, preset: str = "oxy"):
         cursors_dir = os.path.join(target_path, "cursors")
 
         # Mutate the actual state machine binaries
-        for filename in os.listdir(cursors_dir):
-            file_path = os.path.join(cursors_dir, filename)
-            if os.path.islink(file_path):
-                continue
+        with os.scandir(cursors_dir) as it:
+            cursor_files = [entry.path for entry in it if not entry.is_symlink()]
 
+        for file_path in cursor_files:
             with open(file_path, "rb") as f:
                 binary_data = bytearray(f.read())
 
@@ -669,8 +670,92 @@ def bake_awp_cursor(hex_color: str, icon: str = None, preset: str = "oxy"):
     return theme_name
 
 
+# Theme search roots, resolved once at import
+_ICON_SEARCH_PATHS = (
+    '/usr/share/icons',
+    '/usr/local/share/icons',
+    os.path.expanduser('~/.icons'),
+    os.path.expanduser('~/.local/share/icons')
+)
+
+_THEME_SEARCH_PATHS = (
+    '/usr/share/themes',
+    '/usr/local/share/themes',
+    os.path.expanduser('~/.themes'),
+    os.path.expanduser('~/.local/share/themes')
+)
+
+# Sub-directories that mark a theme as carrying a window manager skin
+_WM_COMPONENTS = frozenset({'xfwm4', 'openbox-3', 'metacity-1'})
+
+
+def _scan_theme_dirs(path):
+    """
+    Yield the sub-directory entries of a theme root in a single pass.
+
+    os.scandir() hands back the d_type reported by getdents64, so plain
+    directories are recognised without a stat() per entry. Only symlinked
+    themes (common for distro aliases) still need the kernel to follow them.
+    """
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir():
+                yield entry
+
+
+def _scan_icon_root(path):
+    """Return (icon_themes, cursor_themes) found directly under one icon root."""
+    icons, cursors = [], []
+    # (a missing base path simply raises here and is skipped)
+    try:
+        for entry in _scan_theme_dirs(path):
+            # It's an icon theme
+            icons.append(entry.name)
+            # Check if it's specifically a cursor theme
+            if os.path.isdir(os.path.join(entry.path, 'cursors')):
+                cursors.append(entry.name)
+    except (PermissionError, OSError):
+        pass
+    return icons, cursors
+
+
+def _scan_theme_root(path):
+    """Return (gtk_themes, wm_themes, desktop_themes) found under one theme root."""
+    found, wm, desktop = [], [], []
+    try:
+        for entry in _scan_theme_dirs(path):
+            item = entry.name
+            found.append(item)
+            
+            # One listing of the theme folder answers every component check
+            try:
+                with os.scandir(entry.path) as it:
+                    components = {sub.name for sub in it}
+            except OSError:
+                components = set()
+            
+            # Check for Window Manager components (XFWM, Openbox, Metacity)
+            # This solves your "Greyed out" issue for Openbox/Cinnamon
+            if components & _WM_COMPONENTS:
+                wm.append(item)
+                
+            # Check for Cinnamon Desktop specifically
+            if 'cinnamon' in components:
+                desktop.append(item)
+    except (PermissionError, OSError):
+        pass
+    return found, wm, desktop
+
+
+@functools.lru_cache(maxsize=1)
 def get_available_themes() -> dict:
-    """Discover available themes and return categorised, sorted lists."""
+    """
+    Discover available themes and return categorised, sorted lists.
+
+    The scan is memoized: callers share one result and must treat it as
+    read-only. Call invalidate_theme_cache() after themes are added or
+    removed on disk.
+    """
     themes = {
         'icon_themes': [],
         'gtk_themes': [], 
@@ -679,60 +764,22 @@ def get_available_themes() -> dict:
         'wm_themes': []
     }
     
-    icon_paths = [
-        '/usr/share/icons', 
-        '/usr/local/share/icons',
-        os.path.expanduser('~/.icons'),
-        os.path.expanduser('~/.local/share/icons')
-    ]
-    
-    theme_paths = [
-        '/usr/share/themes',
-        '/usr/local/share/themes', 
-        os.path.expanduser('~/.themes'),
-        os.path.expanduser('~/.local/share/themes')
-    ]
-
-    # 1. Discover Icon and Cursor Themes
-    for path in icon_paths:
-        if os.path.exists(path):
-            try:
-                for item in os.listdir(path):
-                    full_path = os.path.join(path, item)
-                    if os.path.isdir(full_path):
-                        # It's an icon theme
-                        themes['icon_themes'].append(item)
-                        # Check if it's specifically a cursor theme
-                        if os.path.exists(os.path.join(full_path, 'cursors')):
-                            themes['cursor_themes'].append(item)
-            except (PermissionError, OSError):
-                continue
-
-    # 2. Discover GTK and Window Manager Themes
+    # 1+2. Scan every root concurrently; the GIL is released in the syscalls
+    with ThreadPoolExecutor(max_workers=len(_ICON_SEARCH_PATHS) + len(_THEME_SEARCH_PATHS)) as pool:
+        icon_jobs = pool.map(_scan_icon_root, _ICON_SEARCH_PATHS)
+        theme_jobs = pool.map(_scan_theme_root, _THEME_SEARCH_PATHS)
+        icon_results = list(icon_jobs)
+        theme_results = list(theme_jobs)
+
+    for icons, cursors in icon_results:
+        themes['icon_themes'].extend(icons)
+        themes['cursor_themes'].extend(cursors)
+
     all_raw_themes = []
-    for path in theme_paths:
-        if os.path.exists(path):
-            try:
-                for item in os.listdir(path):
-                    full_path = os.path.join(path, item)
-                    if os.path.isdir(full_path):
-                        all_raw_themes.append(item)
-                        
-                        # Check for Window Manager components (XFWM, Openbox, Metacity)
-                        # This solves your "Greyed out" issue for Openbox/Cinnamon
-                        has_wm = any([
-                            os.path.exists(os.path.join(full_path, 'xfwm4')),
-                            os.path.exists(os.path.join(full_path, 'openbox-3')),
-                            os.path.exists(os.path.join(full_path, 'metacity-1'))
-                        ])
-                        if has_wm:
-                            themes['wm_themes'].append(item)
-                            
-                        # Check for Cinnamon Desktop specifically
-                        if os.path.exists(os.path.join(full_path, 'cinnamon')):
-                            themes['desktop_themes'].append(item)
-            except (PermissionError, OSError):
-                continue
+    for found, wm, desktop in theme_results:
+        all_raw_themes.extend(found)
+        themes['wm_themes'].extend(wm)
+        themes['desktop_themes'].extend(desktop)
 
     # 3. Final Sorting & De-duplication (The Alphabetical Fix)
     # We use key=str.lower so 'awp' and 'AWP' sit together
@@ -745,6 +792,11 @@ def get_available_themes() -> dict:
     return themes
 
 
+def invalidate_theme_cache():
+    """Forget the memoized theme scan so the next lookup rescans the disk."""
+    get_available_themes.cache_clear()
+
+
 def clean_old_themes():
     """
     Remove all existing AWP themes from ~/.themes and ~/.icons.
@@ -760,27 +812,28 @@ def clean_old_themes():
     # Clean ~/.themes
     themes_dir = os.path.expanduser("~/.themes")
     if os.path.exists(themes_dir):
-        for item in os.listdir(themes_dir):
-            if item.startswith('awp-'):
-                item_path = os.path.join(themes_dir, item)
-                if os.path.isdir(item_path):
+        with os.scandir(themes_dir) as it:
+            for entry in it:
+                if entry.name.startswith('awp-') and entry.is_dir(follow_symlinks=False):
                     try:
-                        shutil.rmtree(item_path)
-                        removed.append(f"~/.themes/{item}")
+                        shutil.rmtree(entry.path)
+                        removed.append(f"~/.themes/{entry.name}")
                     except Exception:
                         pass
     
     # Clean ~/.icons
     icons_dir = os.path.expanduser("~/.icons")
     if os.path.exists(icons_dir):
-        for item in os.listdir(icons_dir):
-            if item.startswith('awp-'):
-                item_path = os.path.join(icons_dir, item)
-                if os.path.isdir(item_path):
+        with os.scandir(icons_dir) as it:
+            for entry in it:
+                if entry.name.startswith('awp-') and entry.is_dir(follow_symlinks=False):
                     try:
-                        shutil.rmtree(item_path)
-                        removed.append(f"~/.icons/{item}")
+                        shutil.rmtree(entry.path)
+                        removed.append(f"~/.icons/{entry.name}")
                     except Exception:
                         pass
     
+    if removed:
+        invalidate_theme_cache()
+    
     return removed
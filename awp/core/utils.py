@@ -6,19 +6,32 @@ Shared helper functions used by multiple AWP modules.
 
 import os
 import re
+import time
+import glob
+import hashlib
 import shutil
 import subprocess
 import colorsys
-from PIL import Image
+import functools
+import importlib.util
 from pathlib import Path
 from typing import List, Tuple, Optional
 from collections import Counter
-from core.constants import SVG_TEMPLATES
+from operator import itemgetter, attrgetter
+from core.constants import SVG_TEMPLATES, LISTING_CACHE_PATH, LISTING_CACHE_MAX
+from core.runtime import _replace_file, _compact_json, parse_json
+
+# Pillow and NumPy are only needed for icon colour detection; the daemon,
+# nav and HUDs import this module too, so they are imported on first use
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
 
 from core.printer import get_printer
 
 VALID_EXTENSIONS = (".jpg", ".jpeg", ".png", ".webp", ".avif")
 
+# Longest edge get_icon_color() samples; bigger images are decimated first
+ICON_SAMPLE_EDGE = 256
+
 _printer = get_printer()
 
 
@@ -154,33 +167,130 @@ def x11_blanking(timeout_seconds: int):
         _printer.error(f"Blanking Error: {e}", backend="utils")
 
 
+def _dominant_rgb_numpy(img):
+    """
+    NumPy twin of the Counter scan in get_icon_color().
+
+    Packs each visible pixel into one uint32 and counts them with np.unique,
+    so the whole pass runs in C. Ties go to the colour seen first, exactly
+    like Counter.most_common(). Accepts RGBA, RGB or L images and returns
+    None for a fully transparent icon.
+    """
+    import numpy as np
+
+    arr = np.asarray(img, dtype=np.uint32)
+    if img.mode == "L":
+        packed = arr.reshape(-1) * 0x010101
+    else:
+        arr = arr.reshape(-1, arr.shape[-1])
+        if img.mode == "RGBA":
+            arr = arr[arr[:, 3] > 0]
+        packed = (arr[:, 0] << 16) | (arr[:, 1] << 8) | arr[:, 2]
+
+    if not len(packed):
+        return None
+
+    values, first_seen, counts = np.unique(packed, return_index=True, return_counts=True)
+    winners = counts == counts.max()
+    color = int(values[winners][np.argmin(first_seen[winners])])
+    return (color >> 16) & 0xFF, (color >> 8) & 0xFF, color & 0xFF
+
+
 def get_icon_color(image_path: str) -> str:
+    """
+    Return the dominant visible colour of an icon as '#rrggbb' ('' on failure).
+
+    Results are cached per (path, mtime, size), so re-checking an unchanged
+    icon from several tabs or on every save costs a single stat().
+    """
+    try:
+        st = os.stat(image_path)
+    except OSError:
+        return ""
+    return _icon_color_cached(image_path, st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=128)
+def _icon_color_cached(image_path: str, mtime_ns: int, size: int) -> str:
+    from PIL import Image
+
     try:
         with Image.open(image_path) as img:
+            # 0. Don't count more pixels than needed: JPEG can decode at a
+            # reduced DCT scale, anything else oversized is decimated with
+            # NEAREST so every sampled colour is still a real pixel colour
+            img.draft("RGB", (ICON_SAMPLE_EDGE, ICON_SAMPLE_EDGE))
+            if max(img.size) > ICON_SAMPLE_EDGE:
+                img.thumbnail((ICON_SAMPLE_EDGE, ICON_SAMPLE_EDGE), Image.Resampling.NEAREST)
+            
             # 1. Ensure we have an alpha channel to work with
-            img = img.convert("RGBA")
+            # (RGB and greyscale have none: every pixel is visible, so they
+            # are counted as-is without allocating an RGBA copy)
+            if img.mode not in ("RGB", "L"):
+                img = img.convert("RGBA")
             
-            # 2. Get the raw data
-            data = img.getdata()
+            # Fast path: vectorised count when NumPy is available
+            if HAS_NUMPY:
+                most_common = _dominant_rgb_numpy(img)
+                if most_common is None:
+                    return "" # Icon is entirely transparent
+                return f'#{most_common[0]:02x}{most_common[1]:02x}{most_common[2]:02x}'
+            
+            # 2. Let PIL histogram the pixels in C: one (count, pixel) pair
+            # per distinct colour instead of one Python tuple per pixel
+            colors = img.getcolors(img.width * img.height) or []
             
             # 3. Filter: Keep only pixels that are not fully transparent
-            # We check if alpha (data[3]) > 0
-            visible_pixels = [pix[:3] for pix in data if pix[3] > 0]
+            # We check if alpha (pix[3]) > 0
+            visible_pixels = Counter()
+            for count, pix in colors:
+                if img.mode == "RGBA":
+                    if pix[3] > 0:
+                        visible_pixels[pix[:3]] += count
+                elif img.mode == "L":
+                    visible_pixels[(pix, pix, pix)] += count
+                else:
+                    visible_pixels[pix] += count
             
             if not visible_pixels:
                 return "" # Icon is entirely transparent
             
             # 4. Find the most common among visible pixels
-            most_common = Counter(visible_pixels).most_common(1)[0][0]
+            most_common = visible_pixels.most_common(1)[0][0]
             
             return f'#{most_common[0]:02x}{most_common[1]:02x}{most_common[2]:02x}'
     except Exception:
         return ""
 
 
+# The HUDs poll every few seconds: device names behind a mount point hardly
+# ever change, and RAM and swap come from the same /proc/meminfo read
+MOUNT_LABEL_TTL = 60
+MEMINFO_TTL = 1
+
+_mount_label_cache = {}   # tuple(target_mounts) or None -> (expires_at, labels)
+_meminfo_cache = (0.0, None)
+
 def get_dynamic_mount_labels(target_mounts=None):
     """
     Dynamically map mount paths to device labels.
+
+    Cached for MOUNT_LABEL_TTL seconds per set of targets, so polling
+    callers don't fork lsblk on every tick.
+    """
+    key = tuple(target_mounts) if target_mounts is not None else None
+    now = time.monotonic()
+    cached = _mount_label_cache.get(key)
+    if cached and cached[0] > now:
+        return dict(cached[1])
+
+    labels = _read_mount_labels(target_mounts)
+    _mount_label_cache[key] = (now + MOUNT_LABEL_TTL, labels)
+    return dict(labels)
+
+def _read_mount_labels(target_mounts=None):
+    """
+    Map mount paths to device labels via lsblk (uncached).
     
     Args:
         target_mounts: List of mount paths to map (e.g., ["/", "/mnt/internal1500"])
@@ -247,13 +357,23 @@ def get_dynamic_mount_labels(target_mounts=None):
     
     return mount_labels
 
+def _read_meminfo():
+    """/proc/meminfo as {field: kB}, re-read at most every MEMINFO_TTL seconds."""
+    global _meminfo_cache
+    now = time.monotonic()
+    expires_at, mem = _meminfo_cache
+    if mem is None or expires_at <= now:
+        with open('/proc/meminfo', 'r') as f:
+            mem = {line.split()[0].rstrip(':'): int(line.split()[1]) for line in f}
+        _meminfo_cache = (now + MEMINFO_TTL, mem)
+    return mem
+
 def get_ram_info():
     """
     Returns RAM information in unified format: 'used|free|totalG'
     """
     try:
-        with open('/proc/meminfo', 'r') as f:
-            mem = {line.split()[0].rstrip(':'): int(line.split()[1]) for line in f}
+        mem = _read_meminfo()
         
         total = mem['MemTotal'] / 1024 / 1024
         free = mem['MemAvailable'] / 1024 / 1024
@@ -270,8 +390,7 @@ def get_swap_info():
     Returns '0.0|0.0|0.0G' if no swap is present.
     """
     try:
-        with open('/proc/meminfo', 'r') as f:
-            mem = {line.split()[0].rstrip(':'): int(line.split()[1]) for line in f}
+        mem = _read_meminfo()
         
         total = mem.get('SwapTotal', 0) / 1024 / 1024
         free = mem.get('SwapFree', 0) / 1024 / 1024
@@ -307,32 +426,37 @@ def load_images(folder_path: str) -> List[Path]:
     images = []
     
     try:
-        for entry in os.scandir(folder_path):
-            if entry.is_file():
-                name = entry.name.lower()
-                if name.endswith(VALID_EXTENSIONS):
+        # Close the directory fd as soon as the pass ends, also on errors
+        with os.scandir(folder_path) as entries:
+            for entry in entries:
+                # Cheap name test first: is_file() may need a stat()
+                if entry.name.lower().endswith(VALID_EXTENSIONS) and entry.is_file():
                     images.append(Path(entry.path))
     except Exception:
         return []
     
     return images
 
+def _sorted_by_keys(images: List[Path], keys, reverse: bool) -> List[Path]:
+    """Sort images by precomputed keys; itemgetter keeps the sort in C."""
+    pairs = sorted(zip(keys, images), key=itemgetter(0), reverse=reverse)
+    return list(map(itemgetter(1), pairs))
+
+# Orders that depend on file names only, so a folder's mtime (bumped by any
+# create, delete or rename inside it) tells when a sorted listing is stale.
+# The mtime orders also change when a file is touched or re-saved in place.
+NAME_ORDERS = ('name_az', 'name_za')
+
 def sort_images(images: List[Path], order_key: str) -> List[Path]:
     """Sort images based on specified order preference."""
     
     if order_key in ('name_new', 'name_old'):
-        images_with_stat = [(f, f.stat().st_mtime) for f in images]
-        
-        reverse = order_key == 'name_new'
-        images_with_stat.sort(key=lambda x: x[1], reverse=reverse)
-        
-        return [f for f, _ in images_with_stat]
+        mtimes = [f.stat().st_mtime for f in images]
+        return _sorted_by_keys(images, mtimes, reverse=order_key == 'name_new')
 
-    elif order_key == 'name_az':
-        return sorted(images, key=lambda f: f.name.lower())
-
-    elif order_key == 'name_za':
-        return sorted(images, key=lambda f: f.name.lower(), reverse=True)
+    elif order_key in ('name_az', 'name_za'):
+        names = map(str.lower, map(attrgetter('name'), images))
+        return _sorted_by_keys(images, names, reverse=order_key == 'name_za')
 
     return images
 
@@ -341,6 +465,63 @@ def sort_images(images: List[Path], order_key: str) -> List[Path]:
 # SVG ICON GENERATION & UTILITIES
 # =============================================================================
 
+
+def load_sorted_images(folder_path: str, order_key: str) -> List[Path]:
+    """
+    load_images() + sort_images(), reused across processes.
+
+    nav.py runs once per key press; name-sorted listings are kept in
+    /dev/shm and reused while the folder's mtime is unchanged. mtime orders
+    are always sorted afresh (see NAME_ORDERS), like the daemons do.
+    At most LISTING_CACHE_MAX listing files are kept; tmpfs drops them all
+    on reboot.
+    """
+    if order_key not in NAME_ORDERS:
+        return sort_images(load_images(folder_path), order_key)
+
+    try:
+        folder_mtime = os.stat(folder_path).st_mtime_ns
+    except OSError:
+        return []
+
+    folder = os.path.abspath(folder_path)
+    key = [folder, folder_mtime, order_key]
+    digest = hashlib.sha1(f"{folder}\0{order_key}".encode()).hexdigest()[:16]
+    cache_path = LISTING_CACHE_PATH.format(digest)
+
+    try:
+        with open(cache_path, "rb") as f:
+            cached = parse_json(f.read())
+        if cached["key"] == key:
+            return [Path(p) for p in cached["images"]]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass  # Missing, stale or garbled: rebuild it
+
+    images = sort_images(load_images(folder_path), order_key)
+    try:
+        _replace_file(cache_path, _compact_json({"key": key, "images": [str(p) for p in images]}))
+        _prune_listing_cache()
+    except OSError:
+        pass
+    return images
+
+def _prune_listing_cache():
+    """Delete the least recently written listings beyond LISTING_CACHE_MAX."""
+    paths = glob.glob(LISTING_CACHE_PATH.format("*"))
+    if len(paths) <= LISTING_CACHE_MAX:
+        return
+    def written(path):
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return 0
+    paths.sort(key=written)
+    for path in paths[:-LISTING_CACHE_MAX]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
 def generate_icon_from_svg(hex_color, template_name='awp', size=512):
     """
     Generate a PNG icon from an SVG template using rsvg-convert.
@@ -8,32 +8,137 @@ Changes mainly involve enum naming conventions and QApplication initialization.
 """
 import os
 import sys
+import stat
 import shutil
+import mimetypes
+from concurrent.futures import ThreadPoolExecutor
 
 # QT6 IMPORTS
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, 
-    QPushButton, QFileDialog, QComboBox, QMessageBox, QTabWidget, QCheckBox
+    QPushButton, QFileDialog, QComboBox, QMessageBox, QTabWidget, QCheckBox, QCompleter
 )
-from PyQt6.QtCore import Qt, QStandardPaths
-from PyQt6.QtGui import QPixmap
+from PyQt6.QtCore import Qt, QObject, QEvent, QStandardPaths, QTimer, QSignalBlocker, pyqtSlot
+from PyQt6.QtGui import QImageReader, QPixmap, QPixmapCache, QShortcut, QKeySequence
 
 # OTHER IMPORTS
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from core.constants import AWP_DIR, CONFIG_PATH, ICON_DIR, DEFAULT_ICON, THEME_CAPABILITIES
 from core.config import AWPConfig
 from core.utils import get_icon_color, hex_to_hsv
-from core.themes import get_available_themes, bake_awp_theme, bake_awp_icon, bake_awp_cursor
+from core.themes import get_available_themes, invalidate_theme_cache, bake_awp_theme, bake_awp_icon, bake_awp_cursor
 from backends import BACKEND_NAMES
 from core.printer import get_printer
 
 # Initialize printer for dashboard
 _printer = get_printer()
 
+# [general] keys written by the dashboard, in AWPDashboard.general_values() order
+GENERAL_KEYS = ('os_detected', 'session_type', 'blanking_timeout', 'blanking_pause', 'workspaces')
+
+# Fixed option lists for the General tab, built once at import
+DE_ITEMS = tuple(sorted(BACKEND_NAMES))
+SESSION_ITEMS = ("x11", "wayland")
+WS_COUNT_ITEMS = tuple(str(i) for i in range(1, 9))
+BLANKING_ITEMS = (
+    ("Disabled", "0"), ("30 seconds", "30"), ("1 minute", "60"),
+    ("5 minutes", "300"), ("10 minutes", "600"), ("20 minutes", "1200"),
+    ("30 minutes", "1800"), ("1 hour", "3600")
+)
+
+# Fixed option lists for the workspace behavior combos
+TIMING_ITEMS = (
+    ("30 seconds", "30s"), ("1 minute", "1m"), ("5 minutes", "5m"),
+    ("10 minutes", "10m"), ("30 minutes", "30m"), ("1 hour", "1h"),
+    ("24 hours", "24h")
+)
+MODE_ITEMS = (("Random", "random"), ("Sequential", "sequential"))
+ORDER_ITEMS = (
+    ("A-Z (Alphabetical)", "name_az"), ("Z-A (Reverse)", "name_za"),
+    ("Oldest First", "name_old"), ("Newest First", "name_new")
+)
+SCALING_ITEMS = (("Centered", "centered"), ("Scaled", "scaled"), ("Zoomed", "zoomed"))
+
+# Per-workspace theme combos: (label, config key, get_available_themes() key, tooltip)
+THEME_SETTINGS = (
+    ("Icon Theme", "icon_theme", "icon_themes", "Desktop and application icons"),
+    ("GTK Theme", "gtk_theme", "gtk_themes", "Application window appearance"),
+    ("Cursor Theme", "cursor_theme", "cursor_themes", "Mouse cursor style"),
+    ("Desktop Theme", "desktop_theme", "desktop_themes", "Cinnamon desktop panels and widgets"),
+    ("Window Theme", "wm_theme", "wm_themes", "Window borders and controls")
+)
+THEME_MAPPING = {key: theme_type for _, key, theme_type, _ in THEME_SETTINGS}
+
 BASE_FOLDER = QStandardPaths.writableLocation(
     QStandardPaths.StandardLocation.HomeLocation
 )
 
+# The bundled fallback icon does not change while the dashboard runs
+try:
+    _DEFAULT_ICON_MTIME = os.stat(DEFAULT_ICON).st_mtime_ns
+except OSError:
+    _DEFAULT_ICON_MTIME = None
+_DEFAULT_ICON_EXISTS = _DEFAULT_ICON_MTIME is not None
+
+# Source dimensions of cached previews, keyed like their QPixmapCache entry
+_preview_sizes = {}
+
+
+def _scaled_pixmap(path, mtime_ns, width, height):
+    """Load and scale a preview pixmap once per (path, mtime, size).
+
+    The scaled pixmap lives in Qt's QPixmapCache (byte-bounded and released
+    with the application) rather than in a Python-side cache.
+
+    Returns (scaled_pixmap, source_width, source_height).
+    """
+    key = f"awp_icon::{path}::{mtime_ns}::{width}x{height}"
+    scaled = QPixmapCache.find(key)
+    if scaled is None or key not in _preview_sizes:
+        # Let the image plugin decode straight to preview size (JPEG scales
+        # during decode); only formats without a known size take a full load.
+        reader = QImageReader(path)
+        source = reader.size()
+        if source.isValid():
+            reader.setScaledSize(
+                source.scaled(width, height, Qt.AspectRatioMode.KeepAspectRatio))
+            scaled = QPixmap.fromImage(reader.read())
+        else:
+            pix = QPixmap(path)
+            source = pix.size()
+            scaled = pix.scaled(width, height,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.FastTransformation)
+        QPixmapCache.insert(key, scaled)
+        _preview_sizes[key] = (source.width(), source.height())
+    return (scaled, *_preview_sizes[key])
+
+
+class _LazyCompleter(QObject):
+    """
+    Give an editable combo its completer on first focus instead of at creation.
+
+    Most theme combos are never typed into; this spares each of them a
+    QCompleter tracking the model while the tab fills its lists.
+    """
+
+    @classmethod
+    def install(cls, combo):
+        combo.setCompleter(None)
+        combo.lineEdit().installEventFilter(cls(combo))
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.FocusIn:
+            combo = self.parent()
+            completer = QCompleter(combo.model(), combo)
+            completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+            completer.setCompletionMode(QCompleter.CompletionMode.InlineCompletion)
+            combo.setCompleter(completer)
+            obj.removeEventFilter(self)
+            self.deleteLater()
+        return False
+
+
 # =============================================================================
 # WORKSPACE CONFIGURATION TAB
 # =============================================================================
@@ -65,6 +170,30 @@ class WorkspaceTab(QWidget):
         self.index = index
         self.parent_window = parent_window
 
+        # Widgets are created on first activation (see build())
+        self.theme_controls = {}
+        self.is_built = False
+        self._last_icon_key = None
+        self._preview_details = None
+        self._order_n_index = -1  # row of the "Random (n)" order entry, if added
+
+    def showEvent(self, event):
+        """Build the widgets the first time the tab is actually shown."""
+        if not self.is_built:
+            self.parent_window._ensure_tab_built(self)
+        super().showEvent(event)
+
+    def build(self):
+        """
+        Construct the tab's widgets.
+
+        Deferred until the tab is first shown so the dashboard starts without
+        materialising every workspace. Safe to call more than once.
+        """
+        if self.is_built:
+            return
+        self.is_built = True
+
         layout = QVBoxLayout()
         layout.setSpacing(10)
 
@@ -76,8 +205,12 @@ class WorkspaceTab(QWidget):
             combo.setMaximumWidth(250)
             combo.setEditable(True)
             combo.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)  # Qt6 enum
-            for text, data in items:
-                combo.addItem(text, data)
+            _LazyCompleter.install(combo)
+            # One model insertion for all rows, then attach the data
+            with QSignalBlocker(combo):
+                combo.addItems([text for text, _ in items])
+                for i, (_, data) in enumerate(items):
+                    combo.setItemData(i, data)
             return combo
 
         # === WALLPAPER SETTINGS SECTION ===
@@ -115,53 +248,58 @@ class WorkspaceTab(QWidget):
         self.icon_edit.setMaximumWidth(300)
         self.icon_edit.setPlaceholderText("Path to icon file...")
         self.icon_edit.setToolTip("Path to custom icon image (PNG, JPG, SVG)")
-        self.icon_edit.textChanged.connect(self.update_icon_preview)
+        # Debounce: coalesce keystrokes into one preview refresh, and refresh
+        # at once when editing finishes (Enter or focus out)
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(250)
+        self._preview_timer.timeout.connect(self.update_icon_preview)
+        self.icon_edit.textChanged.connect(self._preview_timer.start)
+        self.icon_edit.editingFinished.connect(self._refresh_icon_preview_now)
         row.addWidget(self.icon_edit)
         self.icon_btn = QPushButton("Browse")
         self.icon_btn.setFixedWidth(80)
         self.icon_btn.setToolTip("Browse for icon image file")
         self.icon_btn.clicked.connect(self.on_browse_icon)
         row.addWidget(self.icon_btn)
-        row.addStretch(1)
-        layout.addLayout(row)
 
-        # --- Floating Icon Preview ---
-        self.icon_preview = QLabel(self)
+        # Icon preview, placed by the row's layout next to Browse
+        self.icon_preview = QLabel()
         self.icon_preview.setFixedSize(64, 64)
         self.icon_preview.setToolTip("Loading identity...")
-        # Position it freely
-        self.icon_preview.move(335, self.folder_edit.y() + 35)
-        self.icon_preview.raise_()
+        row.addWidget(self.icon_preview)
+        row.addStretch(1)
+        layout.addLayout(row)
 
         # === WORKSPACE BEHAVIOR SECTION ===
         behavior_label = QLabel("<b>Workspace Behavior</b>")
         layout.addWidget(behavior_label)
 
         # Create behavior combo boxes with tooltips
-        self.timing_combo = create_theme_like_combo([
-            ("30 seconds", "30s"), ("1 minute", "1m"), ("5 minutes", "5m"),
-            ("10 minutes", "10m"), ("30 minutes", "30m"), ("1 hour", "1h"),
-            ("24 hours", "24h")
-        ])
+        self.timing_combo = create_theme_like_combo(TIMING_ITEMS)
         self.timing_combo.setToolTip("How often to rotate wallpapers automatically")
 
-        self.mode_combo = create_theme_like_combo([
-            ("Random", "random"), ("Sequential", "sequential")
-        ])
+        self.mode_combo = create_theme_like_combo(MODE_ITEMS)
         self.mode_combo.setToolTip("Random: random order each time\nSequential: fixed order through wallpapers")
         self.mode_combo.currentTextChanged.connect(self.on_mode_changed)
 
-        self.order_combo = create_theme_like_combo([
-            ("A-Z (Alphabetical)", "name_az"), ("Z-A (Reverse)", "name_za"),
-            ("Oldest First", "name_old"), ("Newest First", "name_new")
-        ])
+        self.order_combo = create_theme_like_combo(ORDER_ITEMS)
         self.order_combo.setToolTip("Sort order for sequential mode wallpapers")
 
-        self.scaling_combo = create_theme_like_combo([
-            ("Centered", "centered"), ("Scaled", "scaled"), ("Zoomed", "zoomed")
-        ])
+        self.scaling_combo = create_theme_like_combo(SCALING_ITEMS)
         self.scaling_combo.setToolTip("How wallpapers fit the screen\nCentered: original size\nScaled: fit to screen\nZoomed: fill screen (cropped)")
 
+        # itemData -> index lookups for the fixed behavior combos
+        self._data_index = {
+            name: {combo.itemData(i): i for i in range(combo.count())}
+            for name, combo in (
+                ("timing", self.timing_combo),
+                ("mode", self.mode_combo),
+                ("order", self.order_combo),
+                ("scaling", self.scaling_combo)
+            )
+        }
+
         # Add behavior rows with labels and tooltips
         behavior_configs = [
             ("Timing:", self.timing_combo, "Wallpaper rotation interval"),
@@ -254,17 +392,7 @@ class WorkspaceTab(QWidget):
         row.addStretch(1)
         layout.addLayout(row)
         
-        self.theme_controls = {}
-        
-        theme_settings = [
-            ("Icon Theme", "icon_theme", "icon_themes", "Desktop and application icons"),
-            ("GTK Theme", "gtk_theme", "gtk_themes", "Application window appearance"),
-            ("Cursor Theme", "cursor_theme", "cursor_themes", "Mouse cursor style"),
-            ("Desktop Theme", "desktop_theme", "desktop_themes", "Cinnamon desktop panels and widgets"),
-            ("Window Theme", "wm_theme", "wm_themes", "Window borders and controls")
-        ]
-        
-        for label, key, theme_type, tooltip in theme_settings:
+        for label, key, theme_type, tooltip in THEME_SETTINGS:
             row = QHBoxLayout()
             row.setSpacing(5)
             lbl = QLabel(f"{label}:")
@@ -285,12 +413,22 @@ class WorkspaceTab(QWidget):
         self.update_theme_availability()
         self.update_icon_preview()
 
-    def update_theme_availability(self):
-        """Update theme dropdown availability based on current DE/WM."""
-        de = self.parent_window.get_current_de().lower()
+    def update_theme_availability(self, de=None, caps=None):
+        """
+        Update theme dropdown availability based on current DE/WM.
+        
+        Args:
+            de (str): Desktop environment; looked up from the dashboard if omitted
+            caps (dict): THEME_CAPABILITIES entry for de, when already resolved
+        """
+        if not self.is_built:
+            return
+        if de is None:
+            de = self.parent_window.get_current_de().lower()
         
         # Get capabilities for this DE, fallback to generic
-        caps = THEME_CAPABILITIES.get(de, THEME_CAPABILITIES['generic'])
+        if caps is None:
+            caps = THEME_CAPABILITIES.get(de, THEME_CAPABILITIES['generic'])
         
         # Window Theme
         wm_combo = self.theme_controls.get('wm_theme')
@@ -318,12 +456,14 @@ class WorkspaceTab(QWidget):
                 
     # --- SIGNAL HANDLERS ---
     
+    @pyqtSlot()
     def on_browse_folder(self):
         """Browse and select wallpaper folder for this workspace."""
         p = QFileDialog.getExistingDirectory(self, f"Select folder for WS{self.index}", BASE_FOLDER)
         if p:
             self.folder_edit.setText(p)
 
+    @pyqtSlot()
     def on_browse_icon(self):
         """Browse and select custom icon for this workspace."""
         start_dir = ICON_DIR if os.path.exists(ICON_DIR) else BASE_FOLDER
@@ -333,7 +473,15 @@ class WorkspaceTab(QWidget):
         )
         if f:
             self.icon_edit.setText(f)
+            self._refresh_icon_preview_now()
+
+    @pyqtSlot()
+    def _refresh_icon_preview_now(self):
+        """Skip the pending debounce and refresh the preview immediately."""
+        self._preview_timer.stop()
+        self.update_icon_preview()
 
+    @pyqtSlot(str)
     def on_mode_changed(self, text):
         """
         Adjust order combo behavior based on rotation mode.
@@ -343,138 +491,177 @@ class WorkspaceTab(QWidget):
         """
         if text == "Random":
             # Force 'n' for random mode
-            found_n = False
-            for i in range(self.order_combo.count()):
-                if self.order_combo.itemData(i) == "n":
-                    found_n = True
-                    self.order_combo.setCurrentIndex(i)
-                    break
-            if not found_n:
-                self.order_combo.addItem("Random (n)", "n")
-                self.order_combo.setCurrentIndex(self.order_combo.count() - 1)
-            self.order_combo.setEnabled(False)
+            self._select_random_order()
         else:
             self.order_combo.setEnabled(True)
-            # Remove 'n' if exists
-            for i in range(self.order_combo.count()):
-                if self.order_combo.itemData(i) == "n":
-                    self.order_combo.removeItem(i)
-                    break
+            self._drop_random_order()
             self.order_combo.setCurrentIndex(0)
 
+    def _select_random_order(self):
+        """Select the "Random (n)" order entry, adding it once, and lock the combo."""
+        if self._order_n_index < 0:
+            self.order_combo.addItem("Random (n)", "n")
+            self._order_n_index = self.order_combo.count() - 1
+        self.order_combo.setCurrentIndex(self._order_n_index)
+        self.order_combo.setEnabled(False)
+
+    def _drop_random_order(self):
+        """Remove the "Random (n)" order entry if it was added."""
+        if self._order_n_index >= 0:
+            self.order_combo.removeItem(self._order_n_index)
+            self._order_n_index = -1
+
+    @pyqtSlot()
     def update_icon_preview(self):
         """Update live preview and show Hex/HSV details in tooltip."""
         path = self.icon_edit.text().strip()
-        display_path = path if (path and os.path.isfile(path)) else (DEFAULT_ICON if os.path.isfile(DEFAULT_ICON) else "")
-        
+        # One stat for the typed path; the default icon's was taken at import
+        display_path, mtime_ns = "", None
+        if path:
+            try:
+                st = os.stat(path)
+            except OSError:
+                st = None
+            if st is not None and stat.S_ISREG(st.st_mode):
+                display_path, mtime_ns = path, st.st_mtime_ns
+        if not display_path and _DEFAULT_ICON_EXISTS:
+            display_path, mtime_ns = DEFAULT_ICON, _DEFAULT_ICON_MTIME
+
+        # Typing that resolves to the same file leaves the preview as it is
+        if (display_path, mtime_ns) == self._last_icon_key:
+            return
+        self._last_icon_key = (display_path, mtime_ns)
+
         if display_path:
-            pix = QPixmap(display_path)
-            self.icon_preview.setPixmap(pix.scaled(60, 60, 
-                Qt.AspectRatioMode.KeepAspectRatio, 
-                Qt.TransformationMode.SmoothTransformation))
-            
-            # 1. Get Hex
-            hex_val = get_icon_color(display_path)
+            scaled, width, height = _scaled_pixmap(display_path, mtime_ns, 60, 60)
+            self.icon_preview.setPixmap(scaled)
             
-            # 2. Convert to HSV if we have a valid hex
-            hsv_info = "N/A"
-            if hex_val:
-                # utils.hex_to_hsv expects the hex without the '#'
-                h, s, v = hex_to_hsv(hex_val.lstrip('#'))
-                # Format to Degrees and Percentages
-                hsv_info = f"H:{int(h * 360)}° S:{int(s * 100)}% V:{int(v * 100)}%"
-            
-            # 3. Build Tooltip
-            filename = os.path.basename(display_path)
-            width = pix.width()
-            height = pix.height()
-            
-            tooltip = (
-                f"<b>File:</b> {filename}<br>"
-                f"<b>Dimensions:</b> {width}x{height} px<br>"
-                f"<b>Hex:</b> {hex_val.upper() if hex_val else 'N/A'}<br>"
-                f"<b>HSV:</b> {hsv_info}"
-            )
-            self.icon_preview.setToolTip(tooltip)
+            # Hex is read from the file; the tooltip is built from these details
+            self._preview_details = (width, height, get_icon_color(display_path))
+            self._set_preview_tooltip(display_path)
             
         else:
             self.icon_preview.clear()
             self.icon_preview.setToolTip("No icon selected")
 
+    def _set_preview_tooltip(self, path):
+        """Show file name, dimensions and Hex/HSV of the previewed icon."""
+        width, height, hex_val = self._preview_details
+
+        # Convert to HSV if we have a valid hex
+        hsv_info = "N/A"
+        if hex_val:
+            # utils.hex_to_hsv expects the hex without the '#'
+            h, s, v = hex_to_hsv(hex_val.lstrip('#'))
+            # Format to Degrees and Percentages
+            hsv_info = f"H:{int(h * 360)}° S:{int(s * 100)}% V:{int(v * 100)}%"
+
+        filename = os.path.basename(path)
+        tooltip = (
+            f"<b>File:</b> {filename}<br>"
+            f"<b>Dimensions:</b> {width}x{height} px<br>"
+            f"<b>Hex:</b> {hex_val.upper() if hex_val else 'N/A'}<br>"
+            f"<b>HSV:</b> {hsv_info}"
+        )
+        self.icon_preview.setToolTip(tooltip)
+
     # --- CONFIG LOAD / SAVE ---
     
     def load_from_config(self, ws_num: int):
         """Load settings from AWPConfig."""
         ws_config = self.parent_window.config.get_workspace_config(ws_num)
-    
-        # Basic settings
-        self.folder_edit.setText(ws_config['folder'])
-        self.icon_edit.setText(ws_config['icon'])
-
-        # Timing
-        timing = ws_config['timing']
-        for i in range(self.timing_combo.count()):
-            if self.timing_combo.itemData(i) == timing:
-                self.timing_combo.setCurrentIndex(i)
-                break
-        else:
-            self.timing_combo.setCurrentText("5 minutes")
 
-        # Mode and order
-        mode = ws_config['mode']
-        self.mode_combo.setCurrentText(mode.title())
-    
-        if mode == "random":
-            found_n = False
-            for i in range(self.order_combo.count()):
-                if self.order_combo.itemData(i) == "n":
-                    found_n = True
-                    self.order_combo.setCurrentIndex(i)
-                    break
-            if not found_n:
-                self.order_combo.addItem("Random (n)", "n")
-                self.order_combo.setCurrentIndex(self.order_combo.count() - 1)
-            self.order_combo.setEnabled(False)
-        else:
-            order = ws_config['order']
-            for i in range(self.order_combo.count()):
-                if self.order_combo.itemData(i) == order:
-                    self.order_combo.setCurrentIndex(i)
-                    break
-            self.order_combo.setEnabled(True)
+        # Set everything with signals and painting off: mode handling is done
+        # inline below and the preview refreshes once at the end, so the tab
+        # repaints a single time instead of once per widget.
+        widgets = (self.folder_edit, self.icon_edit, self.timing_combo,
+                   self.mode_combo, self.order_combo, self.scaling_combo,
+                   *self.theme_controls.values())
+        updates_enabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        blockers = [QSignalBlocker(w) for w in widgets]
+        try:
+            # Basic settings
+            self.folder_edit.setText(ws_config['folder'])
+            self.icon_edit.setText(ws_config['icon'])
+
+            # Timing
+            timing = ws_config['timing']
+            idx = self._data_index['timing'].get(timing)
+            if idx is not None:
+                self.timing_combo.setCurrentIndex(idx)
+            else:
+                self.timing_combo.setCurrentText("5 minutes")
 
-        # Scaling
-        scaling = ws_config['scaling']
-        for i in range(self.scaling_combo.count()):
-            if self.scaling_combo.itemData(i) == scaling:
-                self.scaling_combo.setCurrentIndex(i)
-                break
+            # Mode and order
+            mode = ws_config['mode']
+            idx = self._data_index['mode'].get(mode)
+            if idx is not None:
+                self.mode_combo.setCurrentIndex(idx)
+            else:
+                self.mode_combo.setCurrentText(mode.title())
 
-        # Theme settings
-        for key, combo in self.theme_controls.items():
-            theme_value = ws_config.get(key, '')
-            if theme_value:
-                found = False
-                for i in range(combo.count()):
-                    if combo.itemText(i) == theme_value:
-                        combo.setCurrentIndex(i)
-                        found = True
-                        break
-                if not found:
-                    combo.addItem(theme_value)
-                    combo.setCurrentText(theme_value)
+            if mode == "random":
+                self._select_random_order()
             else:
-                combo.setCurrentIndex(0)  # "(Not set)"
+                # on_mode_changed is blocked; drop a leftover "n" entry here
+                self._drop_random_order()
+                order = ws_config['order']
+                idx = self._data_index['order'].get(order)
+                if idx is not None:
+                    self.order_combo.setCurrentIndex(idx)
+                self.order_combo.setEnabled(True)
+
+            # Scaling
+            scaling = ws_config['scaling']
+            idx = self._data_index['scaling'].get(scaling)
+            if idx is not None:
+                self.scaling_combo.setCurrentIndex(idx)
+
+            # Theme settings
+            for key, combo in self.theme_controls.items():
+                theme_value = ws_config.get(key, '')
+                if theme_value:
+                    idx = combo.findText(theme_value)
+                    if idx >= 0:
+                        combo.setCurrentIndex(idx)
+                    else:
+                        combo.addItem(theme_value)
+                        combo.setCurrentText(theme_value)
+                else:
+                    combo.setCurrentIndex(0)  # "(Not set)"
+        finally:
+            for blocker in blockers:
+                blocker.unblock()
+            self.setUpdatesEnabled(updates_enabled)
 
         self.update_theme_availability()
         self.update_icon_preview()
+        self.update()
 
-    def save_to_config(self):
-        """Save settings to AWPConfig."""
-        config = self.parent_window.config
-        section = f"ws{self.index}"
-    
-        # Get values
+    def _show_copied_icon(self, source, copy):
+        """
+        Point the icon field at a fresh copy without decoding it again.
+
+        The copy has the same pixels as the source already on screen, so only
+        the field, the preview key and the tooltip's file name change.
+        """
+        self._preview_timer.stop()
+        with QSignalBlocker(self.icon_edit):
+            self.icon_edit.setText(copy)
+        if self._last_icon_key and self._last_icon_key[0] == source:
+            self._last_icon_key = (copy, os.stat(copy).st_mtime_ns)
+            self._set_preview_tooltip(copy)
+        else:
+            self.update_icon_preview()
+
+    def import_icon(self):
+        """
+        Copy the selected icon into ICON_DIR under the workspace name.
+        
+        Returns:
+            str: Icon path to store in the config (the copy, when one was made)
+        """
         folder = self.folder_edit.text().strip()
         current_icon_path = self.icon_edit.text().strip()
     
@@ -482,22 +669,15 @@ class WorkspaceTab(QWidget):
         new_icon_path = current_icon_path
         if current_icon_path and os.path.exists(current_icon_path):
             try:
-                # Extract workspace name from folder
-                if folder:
-                    workspace_name = os.path.basename(os.path.normpath(folder))
-                    if not workspace_name or workspace_name == '.':
-                        parts = [p for p in folder.split('/') if p]
-                        workspace_name = parts[-1] if parts else f"ws{self.index}"
-                else:
+                # Extract workspace name from folder (normpath already drops
+                # trailing separators; "/" and relative dots have no name)
+                workspace_name = os.path.basename(os.path.normpath(folder)) if folder else ""
+                if workspace_name in ("", ".", ".."):
                     workspace_name = f"ws{self.index}"
             
-                # Ensure logos directory exists
-                os.makedirs(ICON_DIR, exist_ok=True)
-            
                 # Get file extension
                 _, ext = os.path.splitext(current_icon_path)
                 if not ext:
-                    import mimetypes
                     mime_type, _ = mimetypes.guess_type(current_icon_path)
                     if mime_type:
                         ext = mimetypes.guess_extension(mime_type) or '.png'
@@ -508,42 +688,76 @@ class WorkspaceTab(QWidget):
                 new_icon_name = f"{workspace_name}{ext}"
                 new_icon_path = os.path.join(ICON_DIR, new_icon_name)
             
-                # Copy the file with try-except for SameFileError
+                # Same inode (or a link to it) means it's already in place
                 try:
-                    shutil.copy2(current_icon_path, new_icon_path)
+                    already_there = os.path.samefile(current_icon_path, new_icon_path)
+                except OSError:
+                    already_there = False  # Destination doesn't exist yet
+                
+                # Copy (copyfile: in-kernel sendfile, no chmod/utime follow-ups)
+                if not already_there:
+                    shutil.copyfile(current_icon_path, new_icon_path)
                     _printer.info(f"Icon saved as: {new_icon_path}", backend="dab")
-                    self.icon_edit.setText(new_icon_path)
-                    self.update_icon_preview()
-                except shutil.SameFileError:
-                    pass  # File is already where it should be
+                    self._show_copied_icon(current_icon_path, new_icon_path)
                 
             except Exception as e:
                 _printer.error(f"Could not copy icon: {e}", backend="dab")
+
+        return new_icon_path
+
+    def config_values(self):
+        """
+        Current widget state as the config values save_to_config() writes.
+        
+        Returns:
+            dict: key -> value for every saved field except icon/icon_color
+        """
+        values = {
+            'folder': self.folder_edit.text().strip(),
+            'timing': self.timing_combo.currentData() or '5m',
+            'mode': self.mode_combo.currentText().lower(),
+            'order': self.order_combo.currentData() or 'name_az',
+            'scaling': self.scaling_combo.currentData() or 'scaled'
+        }
+        for key, combo in self.theme_controls.items():
+            text = combo.currentText()
+            values[key] = text if text and text != "(Not set)" else ''  # '' clears theme
+        return values
+
+    def save_to_config(self, new_icon_path=None, color=None):
+        """
+        Store settings in AWPConfig; the caller saves the file.
+        
+        Args:
+            new_icon_path (str): Result of import_icon(), if already run
+            color (str): Detected icon colour, if already computed
+        """
+        config = self.parent_window.config
+        section = f"ws{self.index}"
+        values = self.config_values()
+        if new_icon_path is None:
+            new_icon_path = self.import_icon()
     
-        # Save all settings
-        config.set(section, 'folder', folder)
-        config.set(section, 'icon', new_icon_path)  # Save the new path
-        config.set(section, 'timing', self.timing_combo.currentData() or '5m')
-        config.set(section, 'mode', self.mode_combo.currentText().lower())
-        config.set(section, 'order', self.order_combo.currentData() or 'name_az')
-        config.set(section, 'scaling', self.scaling_combo.currentData() or 'scaled')
+        # Collect all settings; the caller writes the file once
+        updates = {'folder': values['folder'], 'icon': new_icon_path}  # Save the new path
+        for key in ('timing', 'mode', 'order', 'scaling'):
+            updates[key] = values[key]
         
         # Call Color Detection Function
         if new_icon_path and os.path.exists(new_icon_path):
             try:
-                color = get_icon_color(new_icon_path)
+                if color is None:
+                    color = get_icon_color(new_icon_path)
                 if color:
-                    config.set(section, 'icon_color', color)
+                    updates['icon_color'] = color
                     _printer.info(f"WS{self.index}: Color detected: {color}", backend="dab")
             except Exception as e:
                 _printer.warning(f"WS{self.index}: Error detecting color: {e}", backend="dab")
 
         # Theme settings
-        for key, combo in self.theme_controls.items():
-            if combo.currentText() and combo.currentText() != "(Not set)":
-                config.set(section, key, combo.currentText())
-            else:
-                config.set(section, key, '')  # Clear theme
+        for key in self.theme_controls:
+            updates[key] = values[key]
+        config.update_section(section, updates, save=False)
 
 # =============================================================================
 # MAIN DASHBOARD WINDOW
@@ -571,7 +785,11 @@ class AWPDashboard(QWidget):
 
         self.config = AWPConfig()
 
+        # Icon imports land here; create it once rather than on every save
+        os.makedirs(ICON_DIR, exist_ok=True)
+
         self.workspace_tabs = []
+        self._last_de = None
         self.setup_ui()
         self.setup_keybindings()
         self.load_config()
@@ -592,15 +810,22 @@ class AWPDashboard(QWidget):
         self.tab_widget.addTab(self.create_general_tab(), "General Settings")
 
         # Dynamic Workspace tabs generated from config count
+        # (appended in one batch: no per-tab relayout or currentChanged burst)
         num_workspaces = self.config.workspaces_count
+        self.tab_widget.setUpdatesEnabled(False)
+        blocker = QSignalBlocker(self.tab_widget)
         for i in range(1, num_workspaces + 1):
             tab = WorkspaceTab(i, self)
             self.workspace_tabs.append(tab)
             self.tab_widget.addTab(tab, f"Workspace {i}")
+        blocker.unblock()
+        self.tab_widget.setUpdatesEnabled(True)
+        self.tab_widget.update()
 
         layout.addWidget(self.tab_widget)
         
-        # All tabs exist now, so we can safely populate their dropdowns
+        # Populates the dropdowns of whichever tabs are already built;
+        # the rest fill themselves in _ensure_tab_built()
         self.refresh_theme_lists()
         
         # --- Action Buttons: Squeezed for visual harmony (4 buttons in the space of 3) ---
@@ -647,13 +872,21 @@ class AWPDashboard(QWidget):
         self.setLayout(layout)
 
     def setup_keybindings(self):
-        """Configure keyboard shortcuts."""
-        self.save_btn.setShortcut("Ctrl+S")
-        self.backup_btn.setShortcut("Ctrl+B")  
-        self.exit_btn.setShortcut("Ctrl+Q")
+        """Configure window-wide keyboard shortcuts."""
+        QShortcut(QKeySequence("Ctrl+S"), self, activated=self.save_config)
+        QShortcut(QKeySequence("Ctrl+B"), self, activated=self.backup_config)
+        QShortcut(QKeySequence("Ctrl+Q"), self, activated=self.close)
+        
+    def create_standard_combo(self, items=None, width=200, editable=True, pairs=None):
+        """
+        Create a standardized combo box used across all tabs.
         
-    def create_standard_combo(self, items=None, width=200, editable=True):
-        """Create a standardized combo box used across all tabs."""
+        Args:
+            items: Plain strings; each row's text is also its data
+            width (int): Fixed combo width in pixels
+            editable (bool): Show a read-only line edit
+            pairs: (label, data) tuples, for rows whose data differs from the text
+        """
         combo = QComboBox()
         combo.setFixedWidth(width)
         combo.setEditable(editable)
@@ -662,13 +895,23 @@ class AWPDashboard(QWidget):
         if editable:
             combo.lineEdit().setReadOnly(True)
             combo.lineEdit().setAlignment(Qt.AlignmentFlag.AlignLeft)  # Qt6 enum
+            combo.setCompleter(None)  # Read-only text: nothing to complete
 
+        # One row insertion for the whole list, then attach the data
+        blocker = QSignalBlocker(combo)
         if items:
-            for item in items:
-                if isinstance(item, tuple):
-                    combo.addItem(item[0], item[1])
-                else:
-                    combo.addItem(item, item)
+            combo.addItems(items)
+            for i, text in enumerate(items):
+                combo.setItemData(i, text)
+        elif pairs:
+            combo.addItems([label for label, _ in pairs])
+            for i, (_, data) in enumerate(pairs):
+                combo.setItemData(i, data)
+        blocker.unblock()
+
+        # Plain text rows all share one height: skip per-item measuring
+        combo.view().setUniformItemSizes(True)
+        combo.setSizeAdjustPolicy(QComboBox.SizeAdjustPolicy.AdjustToContentsOnFirstShow)
         return combo
 
     def create_general_tab(self):
@@ -679,9 +922,14 @@ class AWPDashboard(QWidget):
         # === Desktop Environment ===
         de_row = QHBoxLayout()
         de_row.addWidget(QLabel("Desktop Environment:"))
-        self.de_combo = self.create_standard_combo(items=sorted(BACKEND_NAMES), width=200)
+        self.de_combo = self.create_standard_combo(items=DE_ITEMS, width=200)
         self.de_combo.setToolTip("Select your desktop environment for proper theme integration")
-        self.de_combo.currentTextChanged.connect(self.on_de_changed)
+        # Coalesce bursts (e.g. wheel-scrolling the combo) into one tab sweep
+        self._de_timer = QTimer(self)
+        self._de_timer.setSingleShot(True)
+        self._de_timer.setInterval(0)
+        self._de_timer.timeout.connect(self._on_de_settled)
+        self.de_combo.currentTextChanged.connect(self._de_timer.start)
         de_row.addWidget(self.de_combo)
         de_row.addStretch()
         layout.addLayout(de_row)
@@ -689,7 +937,7 @@ class AWPDashboard(QWidget):
         # === Session Type ===
         session_row = QHBoxLayout()
         session_row.addWidget(QLabel("Session Type:"))
-        self.session_combo = self.create_standard_combo(items=["x11", "wayland"], width=200)
+        self.session_combo = self.create_standard_combo(items=SESSION_ITEMS, width=200)
         self.session_combo.setToolTip("Display server protocol (X11 or Wayland)")
         session_row.addWidget(self.session_combo)
         session_row.addStretch()
@@ -699,14 +947,10 @@ class AWPDashboard(QWidget):
         layout.addWidget(QLabel("<b>Screen Blanking</b>"))
         blanking_row = QHBoxLayout()
         blanking_row.addWidget(QLabel("Timeout:"))
-        self.blanking_combo = self.create_standard_combo(
-            width=150,
-            items=[
-                ("Disabled", "0"), ("30 seconds", "30"), ("1 minute", "60"),
-                ("5 minutes", "300"), ("10 minutes", "600"), ("20 minutes", "1200"),
-                ("30 minutes", "1800"), ("1 hour", "3600")
-            ]
-        )
+        self.blanking_combo = self.create_standard_combo(width=150, pairs=BLANKING_ITEMS)
+        self.blanking_index = {
+            str(self.blanking_combo.itemData(i)): i for i in range(self.blanking_combo.count())
+        }
         self.blanking_combo.setToolTip("Time before screen blanks/sleeps (X11)")
         self.blanking_combo.currentTextChanged.connect(self.on_blanking_changed)
         blanking_row.addWidget(self.blanking_combo)
@@ -722,7 +966,7 @@ class AWPDashboard(QWidget):
         layout.addWidget(QLabel("<b>Workspace Management</b>"))
         ws_row = QHBoxLayout()
         ws_row.addWidget(QLabel("Number of workspaces:"))
-        self.ws_count_combo = self.create_standard_combo(width=80, items=[str(i) for i in range(1, 9)])
+        self.ws_count_combo = self.create_standard_combo(width=80, items=WS_COUNT_ITEMS)
         self.ws_count_combo.setEnabled(False)
         self.ws_count_combo.setToolTip(
             "Workspace count is determined by your Desktop Environment.\n"
@@ -741,13 +985,26 @@ class AWPDashboard(QWidget):
         """Get current desktop environment selection."""
         return self.de_combo.currentText().lower()
 
+    @pyqtSlot()
+    def _on_de_settled(self):
+        """Apply the DE selection once a burst of changes has settled."""
+        self.on_de_changed(self.de_combo.currentText())
+
+    @pyqtSlot(str)
     def on_de_changed(self, text):
         """Handle DE change and update UI availability."""
-        for i in range(self.tab_widget.count()):
-            tab = self.tab_widget.widget(i)
-            if hasattr(tab, 'update_theme_availability'):
-                tab.update_theme_availability()
+        # Nothing to redo if the debounced burst settled back on the same DE
+        de = self.get_current_de()
+        if de == self._last_de:
+            return
+        self._last_de = de
+
+        # Resolve the capabilities once and hand them to every tab
+        caps = THEME_CAPABILITIES.get(de, THEME_CAPABILITIES['generic'])
+        for tab in self.workspace_tabs:
+            tab.update_theme_availability(de, caps)
 
+    @pyqtSlot(str)
     def on_blanking_changed(self, text):
         """Handle blanking timeout changes."""
         if text == "Disabled":
@@ -757,6 +1014,7 @@ class AWPDashboard(QWidget):
             self.blanking_pause_cb.setChecked(False)
             self.blanking_pause_cb.setEnabled(True)
 
+    @pyqtSlot(bool)
     def on_blanking_pause_toggled(self, checked):
         """Handle blanking pause toggle."""
         if checked:
@@ -766,25 +1024,50 @@ class AWPDashboard(QWidget):
 
     def load_config(self):
         """Load all settings from AWPConfig."""
-        self.de_combo.setCurrentText(self.config.de)
-        self.session_combo.setCurrentText(self.config.session_type)
+        # Set the general widgets silently; the handlers run once afterwards
+        with QSignalBlocker(self.de_combo):
+            self.de_combo.setCurrentText(self.config.de)
+        with QSignalBlocker(self.session_combo):
+            self.session_combo.setCurrentText(self.config.session_type)
     
-        if self.config.blanking_pause or self.config.blanking_timeout == 0:
-            self.blanking_combo.setCurrentText("Disabled")
-            self.blanking_pause_cb.setChecked(True)
-        else:
-            for i in range(self.blanking_combo.count()):
-                if str(self.blanking_combo.itemData(i)) == str(self.config.blanking_timeout):
-                    self.blanking_combo.setCurrentIndex(i)
-                    break
-            self.blanking_pause_cb.setChecked(False)
+        with QSignalBlocker(self.blanking_combo), QSignalBlocker(self.blanking_pause_cb):
+            if self.config.blanking_pause or self.config.blanking_timeout == 0:
+                self.blanking_combo.setCurrentText("Disabled")
+                self.blanking_pause_cb.setChecked(True)
+            else:
+                idx = self.blanking_index.get(str(self.config.blanking_timeout))
+                if idx is not None:
+                    self.blanking_combo.setCurrentIndex(idx)
+                self.blanking_pause_cb.setChecked(False)
+            # Checkbox state is already set above; this just normalises it
+            self.on_blanking_changed(self.blanking_combo.currentText())
     
-        self.ws_count_combo.setCurrentText(str(self.config.workspaces_count))
+        with QSignalBlocker(self.ws_count_combo):
+            self.ws_count_combo.setCurrentText(str(self.config.workspaces_count))
+
+        self.on_de_changed(self.de_combo.currentText())
+
+        # Snapshot of the saved state that the has_*_changes() checks diff against
+        self.baseline = self.config.as_dict()
 
         # Workspace settings - FIXED: kept 0-based indexing for core data structure alignment
+        # (tabs that were never opened load themselves when first built)
         for i, tab in enumerate(self.workspace_tabs):
-            tab.load_from_config(i)
+            if tab.is_built:
+                tab.load_from_config(i)
+
+    def _ensure_tab_built(self, tab):
+        """Build a workspace tab; called from its first showEvent."""
+        if tab.is_built:
+            return
+
+        tab.setUpdatesEnabled(False)
+        tab.build()
+        self._populate_theme_combos(tab, get_available_themes())
+        tab.load_from_config(tab.index - 1)
+        tab.setUpdatesEnabled(True)
 
+    @pyqtSlot()
     def sync_genetic_themes(self):
         """
         Genetic Synchronization: Physically creates ~/.themes and ~/.icons folders
@@ -856,7 +1139,8 @@ class AWPDashboard(QWidget):
                 bake_awp_cursor(hex_color, icon, cursor_preset)
                 baked_cursors_count += 1
         
-        # Refresh the UI dropdowns/lists
+        # Refresh the UI dropdowns/lists (freshly baked themes need a rescan)
+        invalidate_theme_cache()
         self.refresh_theme_lists()
         
         # Feedback
@@ -872,72 +1156,112 @@ class AWPDashboard(QWidget):
     def refresh_theme_lists(self):
         """Universal Refresh: Updates data but respects the UI's visual state."""
         all_themes_dict = get_available_themes()
-        
-        mapping = {
-            "icon_theme": "icon_themes",
-            "gtk_theme": "gtk_themes",
-            "cursor_theme": "cursor_themes",
-            "desktop_theme": "desktop_themes",
-            "wm_theme": "wm_themes"
-        }
 
-        for i, tab in enumerate(self.workspace_tabs):
-            section = f'ws{i+1}'
-            for key, combo in tab.theme_controls.items():
-                saved_val = self.config.get(section, key)
-                theme_type = mapping.get(key)
-                theme_list = all_themes_dict.get(theme_type, [])
-
-                combo.blockSignals(True)
-                combo.clear()
-                
-                # 1. Always start with (Not set) as the first option
-                combo.addItem("(Not set)", "")
+        # Repaint once at the end instead of after every combo refill
+        self.setUpdatesEnabled(False)
+
+        for tab in self.workspace_tabs:
+            self._populate_theme_combos(tab, all_themes_dict)
+
+        self.setUpdatesEnabled(True)
+
+    def _populate_theme_combos(self, tab, all_themes_dict):
+        """Refill one tab's theme combos and reselect the saved values."""
+        section = f'ws{tab.index}'
+        for key, combo in tab.theme_controls.items():
+            saved_val = self.config.get(section, key)
+            theme_type = THEME_MAPPING.get(key)
+            theme_list = all_themes_dict.get(theme_type, [])
+
+            combo.blockSignals(True)
+            combo.clear()
+            
+            # 1. Always start with (Not set) as the first option
+            combo.addItem("(Not set)", "")
+            
+            # 2. Fill with themes in one batch (single model update)
+            combo.addItems(theme_list)
                 
-                # 2. Fill with themes and apply styles
-                for theme in theme_list:
-                    combo.addItem(theme)
-                    
-                # 3. SET THE SELECTION (Universal/Portable Logic)
-                if saved_val and saved_val.strip() != "":
-                    idx = combo.findText(saved_val)
-                    if idx >= 0:
-                        combo.setCurrentIndex(idx)
-                    else:
-                        combo.addItem(saved_val)
-                        new_idx = combo.findText(saved_val)
-                        combo.setCurrentIndex(new_idx)
+            # 3. SET THE SELECTION (Universal/Portable Logic)
+            if saved_val and saved_val.strip() != "":
+                idx = combo.findText(saved_val)
+                if idx >= 0:
+                    combo.setCurrentIndex(idx)
                 else:
-                    fallback_idx = combo.findText("Adwaita")
-                    if fallback_idx >= 0:
-                        combo.setCurrentIndex(fallback_idx)
-                    else:
-                        combo.setCurrentIndex(0)
-                
-                combo.blockSignals(False)
+                    combo.addItem(saved_val)
+                    new_idx = combo.findText(saved_val)
+                    combo.setCurrentIndex(new_idx)
+            else:
+                fallback_idx = combo.findText("Adwaita")
+                if fallback_idx >= 0:
+                    combo.setCurrentIndex(fallback_idx)
+                else:
+                    combo.setCurrentIndex(0)
+            
+            combo.blockSignals(False)
 
+    def general_values(self):
+        """General tab state as config values, in GENERAL_KEYS order."""
+        if self.blanking_pause_cb.isChecked():
+            timeout, pause = '0', 'true'
+        else:
+            timeout, pause = str(self.blanking_combo.currentData() or '0'), 'false'
+        return (
+            self.de_combo.currentText(),
+            self.session_combo.currentText(),
+            timeout,
+            pause,
+            self.ws_count_combo.currentText()
+        )
+
+    def has_general_changes(self):
+        """True when the General tab differs from the saved [general] section."""
+        general = self.baseline.get('general', {})
+        saved = tuple(general.get(key, '') for key in GENERAL_KEYS)
+        return saved != self.general_values()
+
+    def has_workspace_changes(self, tab):
+        """True when a built workspace tab differs from its saved section."""
+        if not tab.is_built:
+            return False
+        current = tab.config_values()
+        current['icon'] = tab.icon_edit.text().strip()
+        section = self.baseline.get(f'ws{tab.index}', {})
+        saved = tuple(section.get(key, '') for key in current)
+        return saved != tuple(current.values())
+
+    @pyqtSlot()
     def save_config(self):
         """Save current GUI state to the active preset via AWPConfig API."""
         try:
             _printer.info("Saving configuration...", backend="dab")
             
-            self.config.set('general', 'os_detected', self.de_combo.currentText())
-            self.config.set('general', 'session_type', self.session_combo.currentText())
-        
-            if self.blanking_pause_cb.isChecked():
-                self.config.set('general', 'blanking_timeout', '0')
-                self.config.set('general', 'blanking_pause', 'true')
-            else:
-                timeout_val = str(self.blanking_combo.currentData() or '0')
-                self.config.set('general', 'blanking_timeout', timeout_val)
-                self.config.set('general', 'blanking_pause', 'false')
-        
-            self.config.set('general', 'workspaces', self.ws_count_combo.currentText())
+            # Only touch what actually changed (unopened tabs hold no edits)
+            general_changed = self.has_general_changes()
+            changed_tabs = [tab for tab in self.workspace_tabs if self.has_workspace_changes(tab)]
+            if not general_changed and not changed_tabs:
+                _printer.info("No changes to save.", backend="dab")
+                QMessageBox.information(self, "No Changes", "Nothing to save: preset is up to date.")
+                return
+            
+            # Sections are updated in memory and written once below
+            if general_changed:
+                self.config.update_section(
+                    'general', dict(zip(GENERAL_KEYS, self.general_values())), save=False)
         
-            for tab in self.workspace_tabs:
-                tab.save_to_config()
+            icon_paths = [tab.import_icon() for tab in changed_tabs]
+
+            # Colour detection decodes images: run each distinct icon once,
+            # in parallel (Pillow releases the GIL while decoding)
+            unique_icons = list(dict.fromkeys(icon_paths))
+            with ThreadPoolExecutor(max_workers=max(1, min(8, len(unique_icons)))) as pool:
+                colors = dict(zip(unique_icons, pool.map(get_icon_color, unique_icons)))
+
+            for tab, icon_path in zip(changed_tabs, icon_paths):
+                tab.save_to_config(icon_path, colors[icon_path])
             
             self.config.save()
+            self.baseline = self.config.as_dict()
             _printer.success("Configuration saved successfully!", backend="dab")
             QMessageBox.information(self, "Success", "Preset updated successfully!")
                 
@@ -945,11 +1269,12 @@ class AWPDashboard(QWidget):
             _printer.error(f"Failed to save: {str(e)}", backend="dab")
             QMessageBox.critical(self, "Error", f"Failed to save: {str(e)}")
 
+    @pyqtSlot()
     def backup_config(self):
         """Create backup of current configuration file."""
         if os.path.exists(self.config.path):
             backup_path = str(self.config.path) + ".backup"
-            shutil.copy(str(self.config.path), backup_path)
+            shutil.copyfile(str(self.config.path), backup_path)
             _printer.success(f"Configuration backed up to: {backup_path}", backend="dab")
             QMessageBox.information(self, "Backup Created", 
                                   f"Configuration backed up to:\n{backup_path}")
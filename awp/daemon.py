@@ -4,20 +4,20 @@ AWP - Automated Wallpaper Program
 Main Daemon Process - NOW USING CORE ACTIONS FOR HELPERS
 """
 import json
+import functools
 import os
 import sys
 import time
 import random
 import subprocess
 from pathlib import Path
-from datetime import datetime
 
 os.environ['NO_AT_BRIDGE'] = '1'
 
-from backends import get_backend
+from backends import get_backend, x11_wait_desktop_change
 from core.constants import AWP_DIR, STATE_PATH, RUNTIME_STATE_PATH, AWP_CONFIG_RAM
 from core.config import AWPConfig, ConfigError
-from core.utils import x11_blanking, load_images, sort_images
+from core.utils import x11_blanking, load_images, sort_images, NAME_ORDERS
 from core.runtime import update_runtime_state, load_index_state, save_index_state, update_ram_config
 from core.actions import (
     get_ws_key,
@@ -25,7 +25,10 @@ from core.actions import (
     parse_timing,
     set_backend,
     set_wallpaper,
-    set_panel_icon
+    set_themes,
+    set_panel_icon,
+    start_backend_worker,
+    theme_fingerprint
 )
 from core.printer import get_printer
 
@@ -42,18 +45,18 @@ def optimize_desktop_environment():
             _printer.info(f"Initializing Lean Mode for {DE}...", backend="daemon")
             func()
 
-def set_themes(ws_num: int, config=None):
-    """Apply theme settings for specified workspace."""
-    backend = get_backend(DE)
-    if backend:
-        func = backend.get("themes")
-        if func:
-            func(ws_num, config)
-
 def configure_screen_blanking(config):
     """Standard AWP Blanking configuration."""
     x11_blanking(config.blanking_timeout)
 
+# Longest sleep between checks for config changes (and, without Xlib,
+# for workspace switches), in seconds
+POLL_INTERVAL = 2
+# Shortest sleep between passes: an overdue deadline must not busy-loop
+MIN_SLEEP = 0.5
+# Shortest rotation interval honoured, in seconds (e.g. for a '0s'/'1s' typo)
+MIN_TIMING = 5
+
 # =============================================================================
 # WORKSPACE MODEL
 # =============================================================================
@@ -61,16 +64,29 @@ def configure_screen_blanking(config):
 class Workspace:
     """Represents a workspace with its wallpaper configuration and state."""
     
+    # (ws_num, path, scaling) last sent to the backend. Shared by all
+    # workspaces: many backends set one desktop-wide wallpaper
+    _last_applied = None
+
+    @classmethod
+    def _wallpaper_failed(cls, applied):
+        """Backend call for applied failed: let the next apply send it again."""
+        if cls._last_applied == applied:
+            cls._last_applied = None
+
     def __init__(self, num: int, config: AWPConfig):
         self.num = num
         self.key = get_ws_key(num)
         self.config = config
+        self.images = []
+        self._listing_key = None  # (folder, folder mtime) the listing was read at
+        self._sorted = {}         # sort order -> sorted listing, for that key
 
         # Preload state
         self.next_index = None
 
         self.reload_images_and_index()
-        self.next_switch_time = time.time() + self.timing
+        self.next_switch_time = time.monotonic() + self.timing
 
     def reload_images_and_index(self):
         """Reload images and configuration from cached config."""
@@ -78,17 +94,30 @@ class Workspace:
     
         self.folder = ws_config['folder']
         self.timing_str = ws_config['timing']
-        self.timing = parse_timing(self.timing_str) or 60
+        self.timing = max(MIN_TIMING, parse_timing(self.timing_str) or 60)
         self.mode = ws_config['mode']
         self.order = ws_config['order']
         self.scaling = ws_config['scaling']
 
-        # Load & sort images
-        self.images = load_images(self.folder)
-        if self.mode == 'sequential':
-            self.images = sort_images(self.images, self.order)
+        # Load & sort images; while the folder is unchanged the listing is
+        # reused (one stat instead of scandir), and each name order is
+        # sorted only once, so mode/order changes in the dashboard are free too
+        sort_key = self.order if self.mode == 'sequential' else 'name_az'
+        try:
+            folder_stat = os.stat(self.folder)
+        except OSError:
+            folder_stat = None
+        listing_key = (self.folder, folder_stat and folder_stat.st_mtime_ns)
+        if listing_key != self._listing_key:
+            self._listing_key = listing_key
+            self._sorted = {None: load_images(self.folder)}
+        if sort_key not in NAME_ORDERS:
+            # Touching a file changes mtime orders but not the folder mtime
+            self.images = sort_images(self._sorted[None], sort_key)
         else:
-            self.images = sort_images(self.images, 'name_az')
+            if sort_key not in self._sorted:
+                self._sorted[sort_key] = sort_images(self._sorted[None], sort_key)
+            self.images = self._sorted[sort_key]
 
         # Load index
         state = load_index_state()
@@ -101,10 +130,7 @@ class Workspace:
         self.next_index = None
 
         # Track folder mtime (for change detection)
-        try:
-            self._last_folder_mtime = os.path.getmtime(self.folder)
-        except Exception:
-            self._last_folder_mtime = 0
+        self._last_folder_mtime = folder_stat.st_mtime if folder_stat else 0
 
     def folder_changed(self) -> bool:
         """Detect if folder contents changed."""
@@ -127,10 +153,10 @@ class Workspace:
         if self.mode == 'random':
             if len(self.images) == 1:
                 return 0
-            new_idx = self.index
-            while new_idx == self.index:
-                new_idx = random.randint(0, len(self.images) - 1)
-            return new_idx
+            # Draw from the other n-1 images and step over the current one:
+            # uniform, and no redraw loop
+            new_idx = random.randrange(len(self.images) - 1)
+            return new_idx + (new_idx >= self.index)
 
         return (self.index + 1) % len(self.images)
 
@@ -165,10 +191,14 @@ class Workspace:
         save_index_state(state)
 
         current_wallpaper_path = str(self.images[self.index])
-        set_wallpaper(self.num, current_wallpaper_path, self.scaling)
+        applied = (self.num, current_wallpaper_path, self.scaling)
+        if applied != Workspace._last_applied:
+            Workspace._last_applied = applied
+            set_wallpaper(self.num, current_wallpaper_path, self.scaling,
+                          on_error=functools.partial(Workspace._wallpaper_failed, applied))
 
         full_info = self.config.generate_runtime_state(
-            f"ws{self.num+1}",
+            self.key,
             current_wallpaper_path
         )
         update_runtime_state(full_info)
@@ -184,20 +214,17 @@ def main_loop(workspaces: dict, config: AWPConfig):
     """Refactored daemon: Logic first, Execution last."""
     global DE, BLANKING_PAUSE, BLANKING_TIMEOUT
     last_ws = None
+    last_themes = None  # theme values last pushed to the desktop
     
-    # Track config file changes
-    last_config_mtime = os.path.getmtime(config.path)
-
     while True:
-        now = time.time()
+        # Monotonic: wall-clock steps (NTP, date changes) do not shift rotations
+        now = time.monotonic()
         
         # -------------------------------------------------
         # 1. CONFIG CHANGE DETECTION (FROM dab.py)
         # -------------------------------------------------
-        current_mtime = os.path.getmtime(config.path)
-        if current_mtime > last_config_mtime:
+        if config.reload_if_changed():
             _printer.info("Config change detected! Re-Syncing ...", backend="daemon")
-            config.reload()
             try:
                 # Convert ConfigParser to a clean dictionary for JSON export
                 full_data = {s: dict(config.config.items(s)) for s in config.config.sections()}
@@ -205,13 +232,14 @@ def main_loop(workspaces: dict, config: AWPConfig):
                 _printer.info("RAM Config updated successfully.", backend="daemon")
             except Exception as e:
                 _printer.error(f"Failed to sync RAM Config: {e}")
-            last_config_mtime = current_mtime
             
             # Backend change
             if config.de != DE:
                 _printer.warning(f"Backend switch: {DE} -> {config.de}", backend="daemon")
                 DE = config.de
                 set_backend(DE)
+                # The new backend has not been sent any wallpaper yet
+                Workspace._last_applied = None
                 optimize_desktop_environment()
             
             # Screen blanking
@@ -228,6 +256,9 @@ def main_loop(workspaces: dict, config: AWPConfig):
 
             if ws:
                 _printer.info(f"Re-applying current workspace WS{ws_num+1}", backend="daemon")
+                # Forced: the desktop may show something set outside the
+                # daemon (e.g. a nav.py effect preview)
+                Workspace._last_applied = None
 
                 ws.reload_images_and_index()
                 ws.apply_index(ws.index)
@@ -237,6 +268,7 @@ def main_loop(workspaces: dict, config: AWPConfig):
                     set_panel_icon(ws_config['icon'])
 
                 set_themes(ws_num, config.config)
+                last_themes = theme_fingerprint(ws_num, config.config)
 
                 ws.next_switch_time = now + ws.timing
 
@@ -256,7 +288,12 @@ def main_loop(workspaces: dict, config: AWPConfig):
                 if ws_config['icon']:
                     set_panel_icon(ws_config['icon'])
 
-                set_themes(ws_num, config.config)
+                # Themes are desktop-wide: skip when this workspace wants
+                # exactly what is already applied (saves the xfconf/gsettings calls)
+                themes = theme_fingerprint(ws_num, config.config)
+                if themes != last_themes:
+                    set_themes(ws_num, config.config)
+                    last_themes = themes
                 
                 ws.next_switch_time = now + ws.timing
                 last_ws = ws_num
@@ -275,15 +312,17 @@ def main_loop(workspaces: dict, config: AWPConfig):
                 ws.next_switch_time = now + ws.timing
 
         # -------------------------------------------------
-        # 3. ADAPTIVE SLEEP (CURRENT WORKSPACE ONLY)
+        # 3. SLEEP UNTIL THE NEXT DEADLINE (CURRENT WORKSPACE ONLY)
         # -------------------------------------------------
+        # Wake at the rotation deadline, but at least every POLL_INTERVAL
+        # seconds to notice config edits, and never more often than MIN_SLEEP
+        sleep_time = POLL_INTERVAL
         if ws:
-            remaining = ws.next_switch_time - now
-            sleep_time = max(0.5, min(2, remaining))
-        else:
-            sleep_time = 1
+            remaining = ws.next_switch_time - time.monotonic()
+            sleep_time = max(MIN_SLEEP, min(POLL_INTERVAL, remaining))
 
-        time.sleep(sleep_time)
+        # Wakes at once on an X11 workspace switch (plain sleep elsewhere)
+        x11_wait_desktop_change(sleep_time)
 
 def main():
     """Main daemon entry point."""
@@ -306,6 +345,8 @@ def main():
     BLANKING_FORMATTED = config.blanking_formatted
 
     set_backend(DE)
+    # Wallpaper/theme/icon calls run off the main loop from here on
+    start_backend_worker()
 
     optimize_desktop_environment()
     configure_screen_blanking(config)
@@ -1,12 +1,59 @@
-import sys, json, os
+import sys, os
+import functools
 from datetime import datetime
-from PyQt6.QtWidgets import QApplication, QWidget, QVBoxLayout, QLabel
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtWidgets import QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel
+from PyQt6.QtCore import Qt, QTimer, QThread, QObject, pyqtSignal, pyqtSlot
 from PyQt6.QtGui import QFont, QColor, QPainter, QBrush
 from core.constants import RUNTIME_STATE_PATH, AWP_CONFIG_RAM, THEME_CAPABILITIES
 from core.utils import get_ram_info, get_swap_info, get_mounts_info, get_dynamic_mount_labels
+from core.runtime import load_json_cached
+
+# Static pieces of the report, built once: a tick only fills in the values
+SEP = " &nbsp;&nbsp;&nbsp; "
+FIELD_TPL = '<span style="color:white;">%s - </span><span style="color:%s;"><b>%s</b></span>'
+
+@functools.lru_cache(maxsize=64)
+def spaced(label):
+    """'FLOW' -> 'F L O W' (a small, fixed set of labels)."""
+    return " ".join(label)
+
+def fmt(label, value, color):
+    value = str(value)
+    if len(value) > 60:
+        value = value[:60] + ".."
+    return FIELD_TPL % (spaced(label), color, value)
+
+class SnapshotWorker(QObject):
+    """
+    Collects what the bar shows (state files, RAM/swap, mounts) on a
+    thread of its own: lsblk, statvfs and file reads never stall painting.
+    """
+    dataReady = pyqtSignal(dict)
+
+    def __init__(self, target_mounts):
+        super().__init__()
+        self.target_mounts = list(target_mounts)
+
+    @pyqtSlot()
+    def collect(self):
+        try:
+            snap = {
+                # One stat() per tick; JSON is only re-parsed after a change
+                "state": load_json_cached(RUNTIME_STATE_PATH),
+                "cfg": load_json_cached(AWP_CONFIG_RAM),
+                "ram": get_ram_info(),
+                "swap": get_swap_info(),
+                "mount_labels": get_dynamic_mount_labels(self.target_mounts),
+                "drives": get_mounts_info(self.target_mounts),
+            }
+        except Exception as e:
+            snap = {"error": str(e)}
+        self.dataReady.emit(snap)
 
 class StudioBar(QWidget):
+    # Asks the worker thread for a fresh snapshot
+    snapshotRequested = pyqtSignal()
+
     def __init__(self):
         super().__init__()
 
@@ -33,19 +80,62 @@ class StudioBar(QWidget):
         self.main_layout.setContentsMargins(6, 6, 6, 6)
         self.main_layout.setSpacing(2)
 
+        font = QFont("Source Code Pro", 10, QFont.Weight.Bold)
+
+        # Line 1 is a row of labels: workspace + clock tick every second
+        # on their own small labels, so the big status labels are only
+        # re-laid out when their content changes. The clock is plain text:
+        # no HTML to parse on each tick
+        self.clock_label = QLabel()
+        self.clock_label.setFont(font)
+        self.clock_label.setTextFormat(Qt.TextFormat.RichText)
+
+        self.time_label = QLabel()
+        self.time_label.setFont(font)
+        self.time_label.setTextFormat(Qt.TextFormat.PlainText)
+        self.time_label.setStyleSheet("color:#999;")
+
+        self.line1_label = QLabel()
+        self.line1_label.setFont(font)
+        self.line1_label.setTextFormat(Qt.TextFormat.RichText)
+
+        line1_row = QHBoxLayout()
+        line1_row.setSpacing(0)
+        line1_row.addStretch()
+        line1_row.addWidget(self.clock_label)
+        line1_row.addWidget(self.time_label)
+        line1_row.addWidget(self.line1_label)
+        line1_row.addStretch()
+
         self.label = QLabel("INITIALIZING...")
-        self.label.setFont(QFont("Source Code Pro", 10, QFont.Weight.Bold))
+        self.label.setFont(font)
         self.label.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
+        self.main_layout.addLayout(line1_row)
         self.main_layout.addWidget(self.label)
         self.setLayout(self.main_layout)
 
         self.target_mounts = ["/", "/mnt/internal1500", "/mnt/internal2000"]
+        self._clock_ws = None  # (workspace, color) shown next to the clock
+
+        # Readings are taken by the worker thread; update_ui() receives them
+        self.worker = SnapshotWorker(self.target_mounts)
+        self.worker_thread = QThread()
+        self.worker.moveToThread(self.worker_thread)
+        self.worker.dataReady.connect(self.update_ui)
+        self.snapshotRequested.connect(self.worker.collect)
+        self.worker_thread.start()
+        QApplication.instance().aboutToQuit.connect(self.stop_worker)
 
         self.timer = QTimer()
-        self.timer.timeout.connect(self.update_ui)
+        self.timer.timeout.connect(self.snapshotRequested)
         self.timer.start(3000)
-        self.update_ui()
+
+        # Lightweight 1s tick: touches the clock label only
+        self.clock_timer = QTimer()
+        self.clock_timer.timeout.connect(self.update_clock)
+        self.clock_timer.start(1000)
+        self.snapshotRequested.emit()
 
     def paintEvent(self, event):
         painter = QPainter(self)
@@ -54,89 +144,120 @@ class StudioBar(QWidget):
         painter.setPen(Qt.PenStyle.NoPen)
         painter.drawRoundedRect(self.rect(), self._r, self._r)
 
-    def update_ui(self):
-        now = datetime.now()
-        time_str = now.strftime("%H:%M:%S")
-        date_str = now.strftime("%Y-%m-%d")
-        ram_str = get_ram_info()
-        swap_str = get_swap_info()
-
-        if os.path.exists(RUNTIME_STATE_PATH):
-            try:
-                with open(RUNTIME_STATE_PATH, "r") as f:
-                    data = json.load(f)
-
-                color = data.get('icon_color', '#ffffff')
-                ws = data.get('workspace_name', '??').upper()
-
-                def fmt(l, v, color):
-                    spaced_label = " ".join(list(l))
-                    val_str = str(v)[:60] + ".." if len(str(v)) > 60 else str(v)
-                    return f'<span style="color:white;">{spaced_label} - </span><span style="color:{color};"><b>{val_str}</b></span>'
-
-                wall_name = os.path.basename(data.get("wallpaper_path", "None"))
-                wall_short = wall_name[:60] + ".." if len(wall_name) > 60 else wall_name
-
-                mount_labels = get_dynamic_mount_labels(self.target_mounts)
-                drives_info = get_mounts_info(self.target_mounts)
-
-                mount_parts = []
-                for path in self.target_mounts:
-                    label = mount_labels.get(path, "???")
-                    mount_parts.append(
-                        fmt(label, drives_info.get(path, "N/A|N/A|N/A"), color)
-                    )
-                mounts_str = " &nbsp;&nbsp;&nbsp; ".join(mount_parts)
-
-                line1 = (
-                    f'<span style="color:white;">〔 <span style="color:{color};">{ws}</span> 〉 </span>'
-                    f'<span style="color:#999;">{date_str} | {time_str}</span> &nbsp;&nbsp;&nbsp; '
-                    f'{fmt("FLOW", data.get("flow", "?"), color)} &nbsp;&nbsp;&nbsp; '
-                    f'{fmt("VIEW", data.get("view", "?"), color)} &nbsp;&nbsp;&nbsp; '
-                    f'{fmt("SORT", data.get("sort", "?"), color)} &nbsp;&nbsp;&nbsp; '
-                    f'{fmt("COLR", data.get("icon_color", "??"), color)} &nbsp;&nbsp;&nbsp; '
-                    f'{fmt("INTV", data.get("intv", "??"), color)} &nbsp;&nbsp;&nbsp; '
-                    f'{fmt("WALL", wall_short, color)}'
-                )
-
-                line2 = (
-                    f'{fmt("MEMR", ram_str, color)} &nbsp;&nbsp;&nbsp; '
-                    f'{fmt("SWAP", swap_str, color)} &nbsp;&nbsp;&nbsp; '
-                    f'{fmt("BLNK", data.get("blanking_timeout", "??"), color)} &nbsp;&nbsp;&nbsp; '
-                    f'{mounts_str}'
-                )
-
-                # line3 — capability-aware theme fields
-                line3_parts = []
-                if os.path.exists(AWP_CONFIG_RAM):
-                    with open(AWP_CONFIG_RAM, "r") as f:
-                        cfg = json.load(f)
-                    general    = cfg.get("general", {})
-                    os_detected = general.get("os_detected", "generic")
-                    caps       = THEME_CAPABILITIES.get(os_detected, THEME_CAPABILITIES["generic"])
-                    ws_cfg     = cfg.get(data.get("workspace_name", ""), {})
-
-                    if caps.get("has_gtk"):
-                        line3_parts.append(fmt("GTKТ", ws_cfg.get("gtk_theme", "?"), color))
-                    if caps.get("has_icons"):
-                        line3_parts.append(fmt("ICON", ws_cfg.get("icon_theme", "?"), color))
-                    if caps.get("has_cursor"):
-                        line3_parts.append(fmt("CURS", ws_cfg.get("cursor_theme", "?"), color))
-                    if caps.get("has_wm_theme"):
-                        line3_parts.append(fmt("WMTH", ws_cfg.get("wm_theme", "?"), color))
-                    if caps.get("has_desktop_theme"):
-                        line3_parts.append(fmt("DESK", ws_cfg.get("desktop_theme", "?"), color))
-
-                line3 = " &nbsp;&nbsp;&nbsp; ".join(line3_parts)
-
-                report = f'<div style="line-height: 125%; text-align: center;">{line1}<br>{line2}<br>{line3}</div>'
-                self.label.setText(report)
-                self.label.setTextFormat(Qt.TextFormat.RichText)
-
-            except Exception as e:
-                self.label.setText(f"FEED ERROR: {str(e)[:50]}")
-        else:
-            self.label.setText("NO STATE FILE")
+    def stop_worker(self):
+        self.timer.stop()
+        self.worker_thread.quit()
+        self.worker_thread.wait()
+
+    def _set_texts(self, *pairs):
+        """
+        Apply (label, text) pairs, skipping unchanged ones: re-laying out
+        rich text is the costly part. When several labels change, updates
+        are suspended meanwhile so the bar repaints once.
+        """
+        changed = [(label, text) for label, text in pairs if label.text() != text]
+        if len(changed) == 1:
+            # A lone label only repaints itself
+            changed[0][0].setText(changed[0][1])
+            return
+        if not changed:
+            return
+        self.setUpdatesEnabled(False)
+        try:
+            for label, text in changed:
+                label.setText(text)
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _show_message(self, text):
+        """Replace the whole bar with a single status message."""
+        self._clock_ws = None
+        self._set_texts((self.clock_label, ""), (self.time_label, ""),
+                        (self.line1_label, ""), (self.label, text))
+
+    def _ws_text(self):
+        ws, color = self._clock_ws
+        return f'<span style="color:white;">〔 <span style="color:{color};">{ws}</span> 〉</span>'
+
+    @staticmethod
+    def _clock_text():
+        return datetime.now().strftime(" %Y-%m-%d | %H:%M:%S \u00a0\u00a0\u00a0 ")
+
+    def update_clock(self):
+        if self._clock_ws is None:
+            return
+        self._set_texts((self.time_label, self._clock_text()))
+
+    @pyqtSlot(dict)
+    def update_ui(self, snap):
+        try:
+            if "error" in snap:
+                raise RuntimeError(snap["error"])
+            data = snap["state"]
+            if data is None:
+                self._show_message("NO STATE FILE")
+                return
+
+            color = data.get('icon_color', '#ffffff')
+            ws = data.get('workspace_name', '??').upper()
+
+            wall_name = os.path.basename(data.get("wallpaper_path", "None"))
+
+            mount_labels = snap["mount_labels"]
+            drives_info = snap["drives"]
+
+            line1 = SEP.join([
+                fmt("FLOW", data.get("flow", "?"), color),
+                fmt("VIEW", data.get("view", "?"), color),
+                fmt("SORT", data.get("sort", "?"), color),
+                fmt("COLR", data.get("icon_color", "??"), color),
+                fmt("INTV", data.get("intv", "??"), color),
+                fmt("WALL", wall_name, color),
+            ])
+
+            line2_parts = [
+                fmt("MEMR", snap["ram"], color),
+                fmt("SWAP", snap["swap"], color),
+                fmt("BLNK", data.get("blanking_timeout", "??"), color),
+            ]
+            for path in self.target_mounts:
+                label = mount_labels.get(path, "???")
+                line2_parts.append(fmt(label, drives_info.get(path, "N/A|N/A|N/A"), color))
+            line2 = SEP.join(line2_parts)
+
+            # line3 — capability-aware theme fields
+            line3_parts = []
+            cfg = snap["cfg"]
+            if cfg is not None:
+                general    = cfg.get("general", {})
+                os_detected = general.get("os_detected", "generic")
+                caps       = THEME_CAPABILITIES.get(os_detected, THEME_CAPABILITIES["generic"])
+                ws_cfg     = cfg.get(data.get("workspace_name", ""), {})
+
+                if caps.get("has_gtk"):
+                    line3_parts.append(fmt("GTKТ", ws_cfg.get("gtk_theme", "?"), color))
+                if caps.get("has_icons"):
+                    line3_parts.append(fmt("ICON", ws_cfg.get("icon_theme", "?"), color))
+                if caps.get("has_cursor"):
+                    line3_parts.append(fmt("CURS", ws_cfg.get("cursor_theme", "?"), color))
+                if caps.get("has_wm_theme"):
+                    line3_parts.append(fmt("WMTH", ws_cfg.get("wm_theme", "?"), color))
+                if caps.get("has_desktop_theme"):
+                    line3_parts.append(fmt("DESK", ws_cfg.get("desktop_theme", "?"), color))
+
+            line3 = SEP.join(line3_parts)
+
+            report = "".join(['<div style="line-height: 125%; text-align: center;">',
+                              line2, '<br>', line3, '</div>'])
+            self.label.setTextFormat(Qt.TextFormat.RichText)
+            self._clock_ws = (ws, color)
+            self._set_texts((self.clock_label, self._ws_text()),
+                            (self.time_label, self._clock_text()),
+                            (self.line1_label, line1),
+                            (self.label, report))
+
+        except Exception as e:
+            self._show_message(f"FEED ERROR: {str(e)[:50]}")
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
@@ -1,14 +1,65 @@
 import sys
-import json
 import os
+import functools
 from datetime import datetime
-from PyQt6.QtWidgets import QApplication, QWidget, QVBoxLayout, QLabel
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtWidgets import QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel
+from PyQt6.QtCore import Qt, QTimer, QThread, QObject, pyqtSignal, pyqtSlot
 from PyQt6.QtGui import QFont, QColor, QPainter, QBrush, QPixmap
 from core.constants import RUNTIME_STATE_PATH, AWP_CONFIG_RAM, THEME_CAPABILITIES
 from core.utils import get_ram_info, get_swap_info, get_mounts_info, get_dynamic_mount_labels
+from core.runtime import load_json_cached
+
+# Static pieces of the report, built once: a tick only fills in the values
+ROW_TPL = ('<div style="text-align: left;">'
+           '<span style="color:white;">%s - </span>'
+           '<span style="color:%s;"><b>%s</b></span>'
+           '</div>')
+DRIVE_TPL = ('<div style="margin-top: 4px;">'
+             '<span style="color:#555; font-size:9px;">%s</span><br>'
+             '<span style="color:white;">%s - </span>'
+             '<span style="color:%s;"><b>%s</b></span>'
+             '</div>')
+DIVIDER = '<div style="color:#444; margin-top: 5px; margin-bottom: 5px;">────────────────────────────────────────────────────────</div>'
+
+@functools.lru_cache(maxsize=64)
+def spaced(label):
+    """'FLOW' -> 'F L O W' (a small, fixed set of labels)."""
+    return " ".join(label)
+
+def fmt(label, value, color):
+    return ROW_TPL % (spaced(label), color, value)
+
+class SnapshotWorker(QObject):
+    """
+    Collects what the HUD shows (state files, RAM/swap, mounts) on a
+    thread of its own: lsblk, statvfs and file reads never stall painting.
+    """
+    dataReady = pyqtSignal(dict)
+
+    def __init__(self, target_mounts):
+        super().__init__()
+        self.target_mounts = list(target_mounts)
+
+    @pyqtSlot()
+    def collect(self):
+        try:
+            snap = {
+                # One stat() per tick; JSON is only re-parsed after a change
+                "state": load_json_cached(RUNTIME_STATE_PATH),
+                "cfg": load_json_cached(AWP_CONFIG_RAM),
+                "ram": get_ram_info(),
+                "swap": get_swap_info(),
+                "mount_labels": get_dynamic_mount_labels(self.target_mounts),
+                "drives": get_mounts_info(self.target_mounts),
+            }
+        except Exception as e:
+            snap = {"error": str(e)}
+        self.dataReady.emit(snap)
 
 class StudioHUD(QWidget):
+    # Asks the worker thread for a fresh snapshot
+    snapshotRequested = pyqtSignal()
+
     def __init__(self):
         super().__init__()
         self.setWindowFlags(
@@ -28,8 +79,32 @@ class StudioHUD(QWidget):
         self.main_layout = QVBoxLayout()
         self.main_layout.setContentsMargins(25, 20, 20, 20)
 
+        font = QFont("Source Code Pro", 11, QFont.Weight.Bold)
+
+        # Workspace + clock tick every second on small labels of their
+        # own; the big report is only re-laid out when it changes. The
+        # clock is plain text: no HTML to parse on each tick
+        self.header_label = QLabel()
+        self.header_label.setFont(font)
+        self.header_label.setTextFormat(Qt.TextFormat.RichText)
+
+        self.time_label = QLabel()
+        self.time_label.setFont(font)
+        self.time_label.setTextFormat(Qt.TextFormat.PlainText)
+        self.time_label.setStyleSheet("color:white;")
+
+        self.tag_label = QLabel('<div style="color:#333; font-size:9px;">AWP - HUD</div>')
+        self.tag_label.setFont(font)
+        self.tag_label.setAlignment(Qt.AlignmentFlag.AlignRight)
+
+        header_row = QHBoxLayout()
+        header_row.setSpacing(0)
+        header_row.addWidget(self.header_label)
+        header_row.addWidget(self.time_label, 0, Qt.AlignmentFlag.AlignBottom)
+        header_row.addStretch()
+
         self.label = QLabel()
-        self.label.setFont(QFont("Source Code Pro", 11, QFont.Weight.Bold))
+        self.label.setFont(font)
         self.label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
 
         self.icon_label = QLabel(self)
@@ -37,15 +112,34 @@ class StudioHUD(QWidget):
         self.icon_label.move(16, 8)
         self.icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
-        self.main_layout.addWidget(self.label)
+        self.main_layout.setSpacing(0)
+        self.main_layout.addWidget(self.tag_label)
+        self.main_layout.addLayout(header_row)
+        self.main_layout.addWidget(self.label, 1)
         self.setLayout(self.main_layout)
 
         self.target_mounts = ["/", "/mnt/internal1500", "/mnt/internal2000"]
+        self._clock_ws = None  # (workspace, color) shown next to the clock
+        self._logo_path = ""    # logo shown by icon_label (None: hidden)
+
+        # Readings are taken by the worker thread; update_ui() receives them
+        self.worker = SnapshotWorker(self.target_mounts)
+        self.worker_thread = QThread()
+        self.worker.moveToThread(self.worker_thread)
+        self.worker.dataReady.connect(self.update_ui)
+        self.snapshotRequested.connect(self.worker.collect)
+        self.worker_thread.start()
+        QApplication.instance().aboutToQuit.connect(self.stop_worker)
 
         self.timer = QTimer()
-        self.timer.timeout.connect(self.update_ui)
+        self.timer.timeout.connect(self.snapshotRequested)
         self.timer.start(3000)
-        self.update_ui()
+
+        # Lightweight 1s tick: touches the header label only
+        self.clock_timer = QTimer()
+        self.clock_timer.timeout.connect(self.update_clock)
+        self.clock_timer.start(1000)
+        self.snapshotRequested.emit()
 
     def paintEvent(self, event):
         painter = QPainter(self)
@@ -54,125 +148,155 @@ class StudioHUD(QWidget):
         painter.setPen(Qt.PenStyle.NoPen)
         painter.drawRoundedRect(self.rect(), 15, 15)
 
-    def update_ui(self):
-        now_time = datetime.now().strftime("%H:%M:%S")
-        now_date = datetime.now().strftime("%Y-%m-%d")
+    def stop_worker(self):
+        self.timer.stop()
+        self.worker_thread.quit()
+        self.worker_thread.wait()
+
+    def _set_texts(self, *pairs):
+        """
+        Apply (label, text) pairs, skipping unchanged ones: re-laying out
+        rich text is the costly part. When several labels change, updates
+        are suspended meanwhile so the HUD repaints once.
+        """
+        changed = [(label, text) for label, text in pairs if label.text() != text]
+        if len(changed) == 1:
+            # A lone label only repaints itself
+            changed[0][0].setText(changed[0][1])
+            return
+        if not changed:
+            return
+        self.setUpdatesEnabled(False)
+        try:
+            for label, text in changed:
+                label.setText(text)
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _show_message(self, text):
+        """Replace the whole HUD with a single status message."""
+        self._clock_ws = None
+        self._set_texts((self.header_label, ""), (self.time_label, ""), (self.label, text))
+
+    def _set_logo(self, logo_path):
+        """Show the workspace logo; the file is only loaded when it changes."""
+        if logo_path == self._logo_path:
+            return
+        self._logo_path = logo_path
+        if logo_path:
+            pix = QPixmap(logo_path)
+            scaled = pix.scaled(40, 40, Qt.AspectRatioMode.KeepAspectRatio,
+                                Qt.TransformationMode.SmoothTransformation)
+            self.icon_label.setPixmap(scaled)
+            self.icon_label.show()
+        else:
+            self.icon_label.clear()
+            self.icon_label.hide()
+
+    def _ws_text(self):
+        ws, color = self._clock_ws
+
+        offset_px = 55
+        first_line_style = f"margin-left: {offset_px}px; padding-left: {offset_px}px;"
+
+        return (
+            f'<div style="text-align: left; line-height: 90%;">'
+            f'<div style="color:white; margin-bottom: 8px; {first_line_style}">'
+            f'〔 <span style="color:{color};">{ws}</span> 〕'
+            f'</div>'
+            f'</div>'
+        )
+
+    @staticmethod
+    def _clock_text():
+        return datetime.now().strftime(" %Y-%m-%d | %H:%M:%S")
 
-        if not os.path.exists(RUNTIME_STATE_PATH):
-            self.label.setText("NO STATE FILE")
+    def update_clock(self):
+        if self._clock_ws is None:
             return
+        self._set_texts((self.time_label, self._clock_text()))
 
+    @pyqtSlot(dict)
+    def update_ui(self, snap):
         try:
-            with open(RUNTIME_STATE_PATH, "r") as f:
-                data = json.load(f)
+            if "error" in snap:
+                raise RuntimeError(snap["error"])
+            data = snap["state"]
+            if data is None:
+                self._show_message("NO STATE FILE")
+                return
 
             color = data.get('icon_color', '#ffffff')
             ws = data.get('workspace_name', '??').upper()
             wall_name = os.path.basename(data.get('wallpaper_path', 'None'))
 
-            ram_val = get_ram_info()
-            swap_val = get_swap_info()
+            ram_val = snap["ram"]
+            swap_val = snap["swap"]
 
-            mount_labels = get_dynamic_mount_labels(self.target_mounts)
-            drives_info = get_mounts_info(self.target_mounts)
+            mount_labels = snap["mount_labels"]
+            drives_info = snap["drives"]
 
             logo_path = data.get('logo_path')
-            if logo_path and os.path.exists(logo_path):
-                pix = QPixmap(logo_path)
-                scaled = pix.scaled(40, 40, Qt.AspectRatioMode.KeepAspectRatio,
-                                    Qt.TransformationMode.SmoothTransformation)
-                self.icon_label.setPixmap(scaled)
-                self.icon_label.show()
-            else:
-                self.icon_label.clear()
-                self.icon_label.hide()
+            self._set_logo(logo_path if logo_path and os.path.exists(logo_path) else None)
+
+            parts = [
+                '<div style="text-align: left; line-height: 90%;">',
+                DIVIDER,
+                fmt("MEMR", ram_val, color),
+                fmt("SWAP", swap_val, color),
+                fmt("BLNK", data.get("blanking_timeout", "??"), color),
+                DIVIDER,
+            ]
+            for path in self.target_mounts:
+                label = mount_labels.get(path, "???")
+                parts.append(DRIVE_TPL % (path, spaced(label), color,
+                                          drives_info.get(path, "N/A|N/A|N/A")))
+            parts += [
+                DIVIDER,
+                fmt("WALL", wall_name, color),
+                fmt("VIEW", data.get("view", "??"), color),
+                fmt("FLOW", data.get("flow", "??"), color),
+                fmt("SORT", data.get("sort", "??"), color),
+                fmt("COLR", data.get("icon_color", "??"), color),
+                fmt("INTV", data.get("intv", "??"), color),
+            ]
 
             # capability-aware theme fields
-            theme_rows = ""
-            if os.path.exists(AWP_CONFIG_RAM):
-                with open(AWP_CONFIG_RAM, "r") as f:
-                    cfg = json.load(f)
+            theme_rows = []
+            cfg = snap["cfg"]
+            if cfg is not None:
                 general     = cfg.get("general", {})
                 os_detected = general.get("os_detected", "generic")
                 caps        = THEME_CAPABILITIES.get(os_detected, THEME_CAPABILITIES["generic"])
                 ws_cfg      = cfg.get(data.get("workspace_name", ""), {})
 
-                def fmt_theme(label, value):
-                    spaced_label = " ".join(list(label))
-                    return (f'<div style="text-align: left;">'
-                            f'<span style="color:white;">{spaced_label} - </span>'
-                            f'<span style="color:{color};"><b>{value}</b></span>'
-                            f'</div>')
-
                 if caps.get("has_gtk"):
-                    theme_rows += fmt_theme("GTKТ", ws_cfg.get("gtk_theme", "?"))
+                    theme_rows.append(fmt("GTKТ", ws_cfg.get("gtk_theme", "?"), color))
                 if caps.get("has_icons"):
-                    theme_rows += fmt_theme("ICON", ws_cfg.get("icon_theme", "?"))
+                    theme_rows.append(fmt("ICON", ws_cfg.get("icon_theme", "?"), color))
                 if caps.get("has_cursor"):
-                    theme_rows += fmt_theme("CURS", ws_cfg.get("cursor_theme", "?"))
+                    theme_rows.append(fmt("CURS", ws_cfg.get("cursor_theme", "?"), color))
                 if caps.get("has_wm_theme"):
-                    theme_rows += fmt_theme("WMTH", ws_cfg.get("wm_theme", "?"))
+                    theme_rows.append(fmt("WMTH", ws_cfg.get("wm_theme", "?"), color))
                 if caps.get("has_desktop_theme"):
-                    theme_rows += fmt_theme("DESK", ws_cfg.get("desktop_theme", "?"))
-
-            def fmt(label, value):
-                spaced_label = " ".join(list(label))
-                return (f'<div style="text-align: left;">'
-                        f'<span style="color:white;">{spaced_label} - </span>'
-                        f'<span style="color:{color};"><b>{value}</b></span>'
-                        f'</div>')
-
-            def drive_row(label, path):
-                spaced_label = " ".join(list(label))
-                value = drives_info.get(path, "N/A|N/A|N/A")
-                return (f'<div style="margin-top: 4px;">'
-                        f'<span style="color:#555; font-size:9px;">{path}</span><br>'
-                        f'<span style="color:white;">{spaced_label} - </span>'
-                        f'<span style="color:{color};"><b>{value}</b></span>'
-                        f'</div>')
-
-            divider = '<div style="color:#444; margin-top: 5px; margin-bottom: 5px;">────────────────────────────────────────────────────────</div>'
-
-            offset_px = 55
-            first_line_style = f"margin-left: {offset_px}px; padding-left: {offset_px}px;"
-
-            mount_rows = ""
-            for path in self.target_mounts:
-                label = mount_labels.get(path, "???")
-                mount_rows += drive_row(label, path)
+                    theme_rows.append(fmt("DESK", ws_cfg.get("desktop_theme", "?"), color))
 
             # only add theme section if there's anything to show
-            theme_section = (f'{divider}{theme_rows}') if theme_rows else ""
-
-            report = (
-                f'<div style="text-align: left; line-height: 90%;">'
-                f'<div align="right" style="color:#333; font-size:9px;">AWP - HUD</div>'
-                f'<div style="color:white; margin-bottom: 8px; {first_line_style}">'
-                f'〔 <span style="color:{color};">{ws}</span> 〕 {now_date} | {now_time}'
-                f'</div>'
-                f'{divider}'
-                f'{fmt("MEMR", ram_val)}'
-                f'{fmt("SWAP", swap_val)}'
-                f'{fmt("BLNK", data.get("blanking_timeout", "??"))}'
-                f'{divider}'
-                f'{mount_rows}'
-                f'{divider}'
-                f'{fmt("WALL", wall_name)}'
-                f'{fmt("VIEW", data.get("view", "??"))}'
-                f'{fmt("FLOW", data.get("flow", "??"))}'
-                f'{fmt("SORT", data.get("sort", "??"))}'
-                f'{fmt("COLR", data.get("icon_color", "??"))}'
-                f'{fmt("INTV", data.get("intv", "??"))}'
-                f'{theme_section}'
-                f'</div>'
-            )
-
-            self.label.setText(report)
+            if theme_rows:
+                parts.append(DIVIDER)
+                parts += theme_rows
+            parts.append('</div>')
+            report = "".join(parts)
+
             self.label.setTextFormat(Qt.TextFormat.RichText)
+            self._clock_ws = (ws, color)
+            self._set_texts((self.header_label, self._ws_text()),
+                            (self.time_label, self._clock_text()),
+                            (self.label, report))
 
         except Exception as e:
             print("Error in vertical HUD:", str(e))
-            self.label.setText(f"ERROR: {str(e)[:50]}")
+            self._show_message(f"ERROR: {str(e)[:50]}")
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
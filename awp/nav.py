@@ -13,9 +13,14 @@ import os
 import sys
 import random
 import json
+import socket
 import subprocess
+import importlib.util
 from pathlib import Path
 
+# Pillow renders the effect previews in-process (ImageMagick otherwise)
+HAS_PIL = importlib.util.find_spec("PIL") is not None
+
 # Optional Qt6 support
 try:
     from PyQt6.QtWidgets import QApplication, QMessageBox
@@ -25,10 +30,10 @@ except ImportError:
     HAS_QT = False
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-from core.constants import AWP_DIR, STATE_PATH, RUNTIME_STATE_PATH, AWP_CONFIG_RAM
+from core.constants import AWP_DIR, STATE_PATH, RUNTIME_STATE_PATH, AWP_CONFIG_RAM, NAV_SOCKET
 from core.config import AWPConfig
-from core.runtime import update_runtime_state, load_index_state, save_index_state
-from core.utils import load_images, sort_images
+from core.runtime import update_runtime_state, load_index_state, save_index_state, load_json_cached
+from core.utils import load_sorted_images
 from core.actions import (
     get_ws_key,
     get_current_workspace,
@@ -43,11 +48,21 @@ _printer = get_printer()
 
 DE = None
 
+NAV_COMMANDS = ("next", "prev", "delete", "sharpen", "black", "color", "park")
+NAV_SAVE_DEBOUNCE = 0.2  # seconds of quiet before serve() writes indexes.json
+
 
 # =============================================================================
 # CONFIGURATION LOADING (RAM-first with HDD fallback)
 # =============================================================================
 
+# (RAM config dict, ConfigParser built from it): rebuilt only when the file
+# changes, which matters in serve() where every key press loads the config
+_ram_config = (None, None)
+
+# AWPConfig behind get_awpconfig_instance(), created on first use
+_awp = None
+
 def get_config():
     """
     Load configuration from RAM disk first, fallback to HDD INI.
@@ -59,10 +74,14 @@ def get_config():
         RAM disk: ~0.1ms (no disk seek)
         HDD INI: ~10-20ms (fallback, disk seek)
     """
+    global _ram_config
     # Attempt to load from RAM disk (fast path)
     try:
-        with open(AWP_CONFIG_RAM, "r") as f:
-            config_dict = json.load(f)
+        config_dict = load_json_cached(AWP_CONFIG_RAM)
+        if config_dict is None:
+            raise FileNotFoundError(AWP_CONFIG_RAM)
+        if config_dict is _ram_config[0]:
+            return _ram_config[1]
         
         # Convert JSON dict to ConfigParser object
         from configparser import ConfigParser
@@ -70,6 +89,7 @@ def get_config():
         for section, values in config_dict.items():
             config[section] = values
         
+        _ram_config = (config_dict, config)
         _printer.info(f"Config loaded from RAM ({len(config_dict)} sections)", backend="nav")
         return config
         
@@ -91,17 +111,26 @@ def get_config():
         raise
 
 
-def get_awpconfig_instance():
+def get_awpconfig_instance(config_parser=None):
     """
-    Create AWPConfig instance with RAM-loaded config.
+    Return the AWPConfig instance, backed by the RAM-loaded config.
     Used for methods that need the full AWPConfig object.
+
+    The INI is parsed once per process; afterwards only the parser is
+    swapped in (and the derived caches dropped) when it changed.
     
     Returns:
         AWPConfig: Configured AWPConfig instance
     """
-    awp = AWPConfig()
-    awp.config = get_config()  # Override with RAM-loaded config
-    return awp
+    global _awp
+    if config_parser is None:
+        config_parser = get_config()
+    if _awp is None:
+        _awp = AWPConfig()
+    if _awp.config is not config_parser:
+        _awp.config = config_parser  # Override with RAM-loaded config
+        _awp._invalidate_caches()
+    return _awp
 
 
 # =============================================================================
@@ -173,22 +202,19 @@ QPushButton:hover {
     return response.strip().upper() == "DELETE"
 
 
-def delete_current_wallpaper_and_advance() -> bool:
+def delete_current_wallpaper_and_advance(config_parser) -> bool:
     """
     Delete current wallpaper and advance to next one.
     
+    Args:
+        config_parser: Config loaded by init_backend()
+
     Returns:
         bool: True if successful, False otherwise
     """
     ws_num = get_current_workspace()
     ws_key = get_ws_key(ws_num)
     
-    # Use RAM-loaded config
-    config_parser = get_config()
-    global DE
-    DE = config_parser.get('general', 'os_detected', fallback='qtile_xfce')
-    set_backend(DE)
-    
     state = load_index_state()
     
     # Get workspace configuration
@@ -203,16 +229,11 @@ def delete_current_wallpaper_and_advance() -> bool:
     scaling = config_parser.get(section, 'scaling', fallback='zoomed')
     
     # Load and sort images
-    imgs = load_images(folder)
+    imgs = load_sorted_images(folder, order if mode == 'sequential' else 'name_az')
     if not imgs:
         _printer.error(f"No images in {folder}", backend="nav")
         return False
     
-    if mode == 'sequential':
-        imgs = sort_images(imgs, order)
-    else:
-        imgs = sort_images(imgs, 'name_az')
-    
     current_idx = int(state.get(ws_key, 0) or 0)
     if current_idx >= len(imgs):
         current_idx = 0
@@ -232,17 +253,13 @@ def delete_current_wallpaper_and_advance() -> bool:
         _printer.error(f"Failed to delete {current_wallpaper}: {e}", backend="nav")
         return False
     
-    # Reload images after deletion
-    imgs = load_images(folder)
+    # Drop it from the list in hand: the rest stays sorted, so there is
+    # no need to scan (and, for mtime orders, stat) the folder again
+    del imgs[current_idx]
     if not imgs:
         _printer.warning("No wallpapers left after deletion", backend="nav")
         return True
     
-    if mode == 'sequential':
-        imgs = sort_images(imgs, order)
-    else:
-        imgs = sort_images(imgs, 'name_az')
-    
     # Calculate new index based on mode
     if mode == 'random':
         if len(imgs) == 1:
@@ -264,7 +281,7 @@ def delete_current_wallpaper_and_advance() -> bool:
     set_wallpaper(ws_num, wallpaper_path, scaling)
     
     # Update runtime state for HUDs
-    awp = get_awpconfig_instance()
+    awp = get_awpconfig_instance(config_parser)
     full_info = awp.generate_runtime_state(f"ws{ws_num + 1}", wallpaper_path)
     update_runtime_state(full_info)
     
@@ -276,19 +293,49 @@ def delete_current_wallpaper_and_advance() -> bool:
 # EFFECT PREVIEW
 # =============================================================================
 
-def apply_effect_preview(effect: str = "sharpen"):
+# ImageMagick arguments per effect (fallback when Pillow is unavailable)
+EFFECT_ARGS = {
+    "sharpen": ["-unsharp", "0x2+0.8+0"],
+    "black": ["-modulate", "100,0,100"],
+    "color": ["-modulate", "100,130,100"],
+}
+
+def render_effect(effect: str, source: str, target: str):
+    """
+    Write source with the effect applied to target.
+
+    Done in-process with Pillow: no convert fork, one decode and encode.
+    Falls back to ImageMagick when Pillow is missing or cannot handle the
+    file (e.g. a format it was built without).
+    """
+    if HAS_PIL:
+        from PIL import Image, ImageEnhance, ImageFilter, ImageOps
+        try:
+            with Image.open(source) as img:
+                if img.mode not in ("RGB", "RGBA"):
+                    img = img.convert("RGB")
+                if effect == "sharpen":
+                    img = img.filter(ImageFilter.UnsharpMask(radius=2, percent=80, threshold=0))
+                elif effect == "black":
+                    img = ImageOps.grayscale(img).convert("RGB")
+                else:  # color
+                    img = ImageEnhance.Color(img).enhance(1.3)
+                img.save(target, quality=92)
+            return
+        except Exception as e:
+            _printer.warning(f"Pillow could not render '{effect}' ({e}), using ImageMagick", backend="nav")
+
+    subprocess.run(["convert", source, *EFFECT_ARGS[effect], target], check=True)
+
+
+def apply_effect_preview(config_parser, effect: str = "sharpen"):
     """
     Apply a temporary effect to the current wallpaper.
     
     Args:
+        config_parser: Config loaded by init_backend()
         effect: Effect type ('sharpen', 'black', 'color')
     """
-    # Use RAM-loaded config
-    config_parser = get_config()
-    global DE
-    DE = config_parser.get('general', 'os_detected', fallback='qtile_xfce')
-    set_backend(DE)
-
     ws_num = get_current_workspace()
     ws_key = get_ws_key(ws_num)
     section = f"ws{ws_num + 1}"
@@ -305,16 +352,11 @@ def apply_effect_preview(effect: str = "sharpen"):
     order = config_parser.get(section, 'order', fallback='name_az')
     scaling = config_parser.get(section, 'scaling', fallback='zoomed')
 
-    imgs = load_images(folder)
+    imgs = load_sorted_images(folder, order if mode == 'sequential' else 'name_az')
     if not imgs:
         _printer.error(f"No images in {folder}", backend="nav")
         return
 
-    if mode == 'sequential':
-        imgs = sort_images(imgs, order)
-    else:
-        imgs = sort_images(imgs, 'name_az')
-
     if idx >= len(imgs):
         idx = 0
 
@@ -327,41 +369,24 @@ def apply_effect_preview(effect: str = "sharpen"):
     # Create temporary file for effect
     filename = os.path.basename(wallpaper_path)
     temp_file = os.path.join(AWP_DIR, filename)
-    os.makedirs(os.path.dirname(temp_file), exist_ok=True)
 
-    cmd = ["convert", wallpaper_path]
-
-    if effect == "sharpen":
-        cmd += ["-unsharp", "0x2+0.8+0"]
-    elif effect == "black":
-        cmd += ["-modulate", "100,0,100"]
-    elif effect == "color":
-        cmd += ["-modulate", "100,130,100"]
-    else:
+    if effect not in EFFECT_ARGS:
         _printer.error(f"Unknown effect: {effect}", backend="nav")
         return
 
-    cmd.append(temp_file)
-
     try:
-        subprocess.run(cmd, check=True)
+        render_effect(effect, wallpaper_path, temp_file)
         set_wallpaper(ws_num, temp_file, scaling)
         _printer.info(f"Applied temporary effect '{effect}' to wallpaper", backend="nav")
     except Exception as e:
         _printer.error(f"Failed to apply effect '{effect}': {e}", backend="nav")
 
 
-def park_current():
+def park_current(config_parser):
     """
     Park at current indexed wallpaper (no rotation, just apply).
     Used when switching workspaces to restore the correct wallpaper.
     """
-    # Use RAM-loaded config
-    config_parser = get_config()
-    global DE
-    DE = config_parser.get('general', 'os_detected', fallback='qtile_xfce')
-    set_backend(DE)
-    
     ws_num = get_current_workspace()
     ws_key = get_ws_key(ws_num)
     section = f"ws{ws_num + 1}"
@@ -375,16 +400,11 @@ def park_current():
     order = config_parser.get(section, 'order', fallback='name_az')
     scaling = config_parser.get(section, 'scaling', fallback='zoomed')
     
-    imgs = load_images(folder)
+    imgs = load_sorted_images(folder, order if mode == 'sequential' else 'name_az')
     if not imgs:
         _printer.error(f"No images in {folder}", backend="nav")
         return
     
-    if mode == 'sequential':
-        imgs = sort_images(imgs, order)
-    else:
-        imgs = sort_images(imgs, 'name_az')
-    
     state = load_index_state()
     idx = int(state.get(ws_key, 0) or 0)
     
@@ -399,61 +419,27 @@ def park_current():
     set_wallpaper(ws_num, wallpaper_path, scaling)
     
     # Update runtime state for HUDs
-    awp = get_awpconfig_instance()
+    awp = get_awpconfig_instance(config_parser)
     full_info = awp.generate_runtime_state(f"ws{ws_num + 1}", wallpaper_path)
     update_runtime_state(full_info)
     
     _printer.info(f"WS{ws_num + 1}: Parked at index {idx}", backend="nav")
 
 
-def main():
-    """Main navigation controller entry point."""
-    allowed = ("next", "prev", "delete", "sharpen", "black", "color", "park")
-    if len(sys.argv) != 2 or sys.argv[1] not in allowed:
-        _printer.error(f"Usage: {sys.argv[0]} " + " | ".join(allowed), backend="nav")
-        sys.exit(1)
-
-    command = sys.argv[1]
-
-    # --- 1. INITIALIZE CONFIG & BACKEND (RAM-first) ---
-    # Load configuration from RAM disk (fast) or HDD fallback
-    config_parser = get_config()
-    global DE
-    DE = config_parser.get('general', 'os_detected', fallback='qtile_xfce')
-    set_backend(DE)
-
-    # --- 2. TEMPORAL EFFECTS ---
-    if command in ("sharpen", "black", "color"):
-        os.makedirs(AWP_DIR, exist_ok=True)
-        _printer.info(f"Applying effect: {command}", backend="nav")
-        apply_effect_preview(command)
-        return
-    
-    # --- 3. PARK (Restore current wallpaper) ---
-    if command == "park":
-        os.makedirs(AWP_DIR, exist_ok=True)
-        _printer.info("Parking wallpaper...", backend="nav")
-        park_current()
-        return
-    
-    # --- 4. DELETION ---
-    if command == "delete":
-        os.makedirs(AWP_DIR, exist_ok=True)
-        _printer.info("Deleting current wallpaper...", backend="nav")
-        success = delete_current_wallpaper_and_advance()
-        sys.exit(0 if success else 1)
-    
-    # --- 5. NAVIGATION (NEXT/PREV) ---
-    direction = command
-    os.makedirs(AWP_DIR, exist_ok=True)
+def navigate(direction: str, config_parser, state: dict) -> bool:
+    """
+    Step the current workspace to the next/previous wallpaper.
 
+    Updates state (the indexes.json dict) in place; saving it is left to the
+    caller. Returns False if there is nothing to navigate.
+    """
     ws_num = get_current_workspace()
     ws_key = get_ws_key(ws_num)
     section = f"ws{ws_num + 1}"
 
     if not config_parser.has_section(section):
         _printer.error(f"Section {section} not found in config", backend="nav")
-        sys.exit(1)
+        return False
 
     folder = config_parser.get(section, 'folder')
     mode = config_parser.get(section, 'mode', fallback='sequential')
@@ -461,18 +447,12 @@ def main():
     scaling = config_parser.get(section, 'scaling', fallback='zoomed')
 
     # Load and sort images
-    imgs = load_images(folder)
+    imgs = load_sorted_images(folder, order if mode == 'sequential' else 'name_az')
     if not imgs:
         _printer.error(f"No images in {folder}", backend="nav")
-        sys.exit(1)
-
-    if mode == 'sequential':
-        imgs = sort_images(imgs, order)
-    else:
-        imgs = sort_images(imgs, 'name_az')
+        return False
 
     # Get current index from state
-    state = load_index_state()
     idx = int(state.get(ws_key, 0) or 0)
     last_idx = int(state.get(ws_key + '_last', -1) or -1)
     
@@ -496,21 +476,152 @@ def main():
         else:
             new_idx = (idx - 1) % len(imgs)
 
-    # Update state (indexes.json)
+    # Update state (indexes.json, written by the caller)
     state[ws_key + '_last'] = idx
     state[ws_key] = new_idx
-    save_index_state(state)
 
     # Apply the wallpaper via backend
     wallpaper_path = str(imgs[new_idx])
     set_wallpaper(ws_num, wallpaper_path, scaling)
     
     # Update runtime state for HUDs
-    awp = get_awpconfig_instance()
+    awp = get_awpconfig_instance(config_parser)
     full_info = awp.generate_runtime_state(f"ws{ws_num + 1}", wallpaper_path)
     update_runtime_state(full_info)
     
     _printer.info(f"WS{ws_num + 1}: {direction} wallpaper changed", backend="nav")
+    return True
+
+
+_awp_dir_ready = False
+
+def ensure_awp_dir():
+    """Create AWP_DIR if missing; checked once per process, not per command."""
+    global _awp_dir_ready
+    if not _awp_dir_ready:
+        if not os.path.isdir(AWP_DIR):
+            os.makedirs(AWP_DIR, exist_ok=True)
+        _awp_dir_ready = True
+
+
+def init_backend():
+    """
+    Load the config (RAM-first) and select its backend. Returns the parser.
+
+    The one place a command loads config: the helpers take the parser.
+    """
+    config_parser = get_config()
+    global DE
+    de = config_parser.get('general', 'os_detected', fallback='qtile_xfce')
+    if de != DE:
+        DE = de
+        set_backend(DE)
+    return config_parser
+
+
+def run_command(command: str) -> bool:
+    """Run one navigation command. Returns False on failure."""
+    # --- 1. INITIALIZE CONFIG & BACKEND (RAM-first) ---
+    # Load configuration from RAM disk (fast) or HDD fallback
+    config_parser = init_backend()
+    ensure_awp_dir()
+
+    # --- 2. TEMPORAL EFFECTS ---
+    if command in ("sharpen", "black", "color"):
+        _printer.info(f"Applying effect: {command}", backend="nav")
+        apply_effect_preview(config_parser, command)
+        return True
+    
+    # --- 3. PARK (Restore current wallpaper) ---
+    if command == "park":
+        _printer.info("Parking wallpaper...", backend="nav")
+        park_current(config_parser)
+        return True
+    
+    # --- 4. DELETION ---
+    if command == "delete":
+        _printer.info("Deleting current wallpaper...", backend="nav")
+        return delete_current_wallpaper_and_advance(config_parser)
+    
+    # --- 5. NAVIGATION (NEXT/PREV) ---
+    state = load_index_state()
+    if not navigate(command, config_parser, state):
+        return False
+    save_index_state(state)
+    return True
+
+
+def serve():
+    """
+    Long-lived mode: run commands sent as datagrams to NAV_SOCKET.
+
+    Saves starting Python per key press, e.g. bind keys to
+    `echo next | socat - UNIX-SENDTO:/dev/shm/awp_nav.sock`. The index of a
+    burst of next/prev presses is kept in memory and written once, after
+    NAV_SAVE_DEBOUNCE seconds without another press.
+    """
+    try:
+        os.unlink(NAV_SOCKET)
+    except FileNotFoundError:
+        pass
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    sock.bind(NAV_SOCKET)
+    _printer.info(f"Listening on {NAV_SOCKET}", backend="nav")
+
+    pending = None  # index state not written yet
+    try:
+        while True:
+            # Block until the next command, or until the debounce window ends
+            sock.settimeout(NAV_SAVE_DEBOUNCE if pending is not None else None)
+            try:
+                command = sock.recv(64).decode(errors="replace").strip()
+            except socket.timeout:
+                save_index_state(pending)
+                pending = None
+                continue
+
+            if command not in NAV_COMMANDS:
+                _printer.warning(f"Ignoring unknown command: {command!r}", backend="nav")
+                continue
+
+            try:
+                if command in ("next", "prev"):
+                    config_parser = init_backend()
+                    state = pending if pending is not None else load_index_state()
+                    if navigate(command, config_parser, state):
+                        pending = state
+                else:
+                    # Other commands read indexes.json themselves
+                    if pending is not None:
+                        save_index_state(pending)
+                        pending = None
+                    run_command(command)
+            except Exception as e:
+                _printer.error(f"{command} failed: {e}", backend="nav")
+    finally:
+        if pending is not None:
+            save_index_state(pending)
+        sock.close()
+        try:
+            os.unlink(NAV_SOCKET)
+        except OSError:
+            pass
+
+
+def main():
+    """Main navigation controller entry point."""
+    allowed = NAV_COMMANDS + ("serve",)
+    if len(sys.argv) != 2 or sys.argv[1] not in allowed:
+        _printer.error(f"Usage: {sys.argv[0]} " + " | ".join(allowed), backend="nav")
+        sys.exit(1)
+
+    command = sys.argv[1]
+    if command == "serve":
+        serve()
+        return
+
+    if not run_command(command):
+        sys.exit(1)
 
 
 if __name__ == "__main__":
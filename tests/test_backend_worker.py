@@ -0,0 +1,33 @@
+import os
+import sys
+import queue
+import threading
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "awp"))
+
+from core.actions import _backend_worker
+
+
+class BackendWorkerTest(unittest.TestCase):
+    def test_repeated_key_runs_at_its_last_position(self):
+        jobs = queue.Queue()
+        applied = []
+        release = threading.Event()
+        done = threading.Event()
+
+        # Keep the worker busy while A, B, A queue up behind it
+        jobs.put(("busy", release.wait, (), None))
+        threading.Thread(target=_backend_worker, args=(jobs,), daemon=True).start()
+
+        for ws in ("A", "B", "A"):
+            jobs.put((("wallpaper", ws), applied.append, (ws,), None))
+        jobs.put(("done", done.set, (), None))
+
+        release.set()
+        self.assertTrue(done.wait(5))
+        self.assertEqual(applied, ["B", "A"])
+
+
+if __name__ == "__main__":
+    unittest.main()